@@ -1,14 +1,86 @@
+from functools import lru_cache
+from typing import Any, Dict, Optional
 from tinydb import TinyDB
+from tinydb.middlewares import CachingMiddleware
+from tinydb.storages import Storage, touch
+import mmap
+import orjson
 import os
 
+DEFAULT_DB_PATH = "database/db.json"
+
+# Number of writes kept in memory before the cache is flushed to disk
+WRITE_CACHE_SIZE = 1000
+
+
+class OrjsonStorage(Storage):
+    """
+    JSON file storage for TinyDB using orjson instead of the stdlib json module.
+
+    Modeled on TinyDB's JSONStorage; the file is handled in binary mode since
+    orjson reads and writes UTF-8 bytes directly, and reads are memory-mapped.
+    """
+
+    def __init__(self, path: str, create_dirs: bool = False):
+        super().__init__()
+        touch(path, create_dirs=create_dirs)
+        self._handle = open(path, mode='rb+')
+
+    def close(self) -> None:
+        self._handle.close()
+
+    def read(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        # Get the file size by moving the cursor to the end of the file
+        self._handle.seek(0, os.SEEK_END)
+        if not self._handle.tell():
+            # Empty file, let TinyDB initialize the database
+            return None
+
+        # Parse straight from a read-only memory map of the file, so the JSON text
+        # is not first copied into a bytes object (the pages come from the OS cache)
+        with mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return orjson.loads(memoryview(mapped))
+
+    def write(self, data: Dict[str, Dict[str, Any]]) -> None:
+        self._handle.seek(0)
+        self._handle.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+
+        # Ensure the file has been written
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+
+        # Remove leftover data in case the file has gotten shorter
+        self._handle.truncate()
+
+
 class DatabaseBase:
     def __init__(self, db_path: str = "db.json"):
         # Ensure the directory exists
         db_dir = os.path.dirname(db_path)
         if db_dir and not os.path.exists(db_dir):
             os.makedirs(db_dir)
-            
-        self.db = TinyDB(db_path)
+
+        # Batch writes in memory instead of rewriting the whole JSON file on every insert/update
+        storage = CachingMiddleware(OrjsonStorage)
+        storage.WRITE_CACHE_SIZE = WRITE_CACHE_SIZE
+        self.db = TinyDB(db_path, storage=storage)
 
     def get_db(self):
         return self.db
+
+    def flush(self) -> None:
+        """
+        Write any cached changes to disk.
+        """
+        self.db.storage.flush()
+
+
+@lru_cache(maxsize=None)
+def get_database_base(db_path: str = DEFAULT_DB_PATH) -> DatabaseBase:
+    """
+    Get the shared DatabaseBase for a database file.
+
+    Every repository using the same file must share one instance, otherwise
+    their write caches would overwrite each other on flush.
+    """
+    return DatabaseBase(db_path)
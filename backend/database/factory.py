@@ -0,0 +1,27 @@
+from typing import Union
+import os
+from database.database_base import DatabaseBase
+from database.sqlite_tour import DEFAULT_SQLITE_PATH, SQLiteTourRepository
+from database.tour import TourRepository
+
+
+def create_tour_repository(db_base: DatabaseBase) -> Union[TourRepository, SQLiteTourRepository]:
+    """
+    Create the tour repository for the configured storage backend.
+
+    TOUR_DB_BACKEND selects the engine: "sqlite" (default) or "tinydb".
+    """
+    backend = os.getenv("TOUR_DB_BACKEND", "sqlite").lower()
+    if backend == "sqlite":
+        repo = SQLiteTourRepository(os.getenv("TOUR_SQLITE_PATH", DEFAULT_SQLITE_PATH))
+        if repo.is_empty():
+            # First start on SQLite: carry over the tours stored by the TinyDB backend
+            legacy_tours = db_base.get_db().table('tours').all()
+            if legacy_tours:
+                # The UUID column is unique; keep the last stored copy of a duplicated tour
+                latest = {tour.get('id', tour.doc_id): dict(tour) for tour in legacy_tours}
+                repo.add_tours(list(latest.values()))
+        return repo
+    if backend == "tinydb":
+        return TourRepository(db_base)
+    raise ValueError(f"Unknown TOUR_DB_BACKEND: {backend}")
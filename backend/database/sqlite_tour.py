@@ -0,0 +1,156 @@
+from typing import List, Optional, Dict, Any
+import orjson
+import os
+import sqlite3
+import threading
+
+DEFAULT_SQLITE_PATH = "database/tours.sqlite3"
+
+
+class SQLiteTourRepository:
+    """
+    Tour repository backed by sqlite3, with the same interface as TourRepository.
+
+    Each tour is stored as a JSON blob next to an indexed UUID column, so UUID
+    lookups and updates only touch a single row instead of the whole file.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_SQLITE_PATH):
+        # Ensure the directory exists
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+
+        # Autocommit mode; multi-statement updates open explicit transactions
+        self.conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS tours ("
+            "doc_id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "uuid TEXT UNIQUE, "
+            "data TEXT NOT NULL)"
+        )
+        # The connection is shared by the request handlers and background tasks
+        self._lock = threading.Lock()
+
+    def add_tour(self, tour_data: Dict[str, Any]) -> int:
+        """
+        Add a new tour to the database.
+        Returns the inserted document ID.
+        """
+        with self._lock:
+            cursor = self.conn.execute(
+                "INSERT INTO tours (uuid, data) VALUES (?, ?)",
+                (tour_data.get('id'), orjson.dumps(tour_data))
+            )
+        return cursor.lastrowid
+
+    def add_tours(self, tours: List[Dict[str, Any]]) -> List[int]:
+        """
+        Add several tours in a single transaction.
+        Returns the inserted document IDs, in input order.
+        """
+        doc_ids = []
+        with self._lock:
+            self.conn.execute("BEGIN")
+            try:
+                for tour_data in tours:
+                    cursor = self.conn.execute(
+                        "INSERT INTO tours (uuid, data) VALUES (?, ?)",
+                        (tour_data.get('id'), orjson.dumps(tour_data))
+                    )
+                    doc_ids.append(cursor.lastrowid)
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        return doc_ids
+
+    def is_empty(self) -> bool:
+        """
+        Check whether the database holds no tours yet.
+        """
+        with self._lock:
+            row = self.conn.execute("SELECT 1 FROM tours LIMIT 1").fetchone()
+        return row is None
+
+    def get_tour(self, tour_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a tour by its document ID.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT data FROM tours WHERE doc_id = ?", (tour_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return orjson.loads(row[0])
+
+    def get_tour_by_uuid(self, tour_uuid: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a tour by its UUID.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT data FROM tours WHERE uuid = ?", (tour_uuid,)
+            ).fetchone()
+        if row is None:
+            return None
+        return orjson.loads(row[0])
+
+    def list_tours(self) -> List[Dict[str, Any]]:
+        """
+        List all tours in the database.
+        """
+        with self._lock:
+            rows = self.conn.execute("SELECT data FROM tours ORDER BY doc_id").fetchall()
+        return [orjson.loads(row[0]) for row in rows]
+
+    def update_tour(self, tour_id: int, updates: Dict[str, Any]) -> None:
+        """
+        Update a tour by its ID.
+        """
+        self._update_where("doc_id", tour_id, updates)
+
+    def update_tour_by_uuid(self, tour_uuid: str, updates: Dict[str, Any]) -> bool:
+        """
+        Update a tour by its UUID.
+        Returns True if updated, False if tour not found.
+        """
+        return self._update_where("uuid", tour_uuid, updates)
+
+    def _update_where(self, column: str, key: Any, updates: Dict[str, Any]) -> bool:
+        # Top-level keys are replaced in place by a single UPDATE (json_set, unlike json_patch,
+        # keeps dict.update semantics for nulls and nested objects). The stored blob is cast to
+        # TEXT so it is not read as binary JSONB by newer SQLite versions
+        if not updates:
+            with self._lock:
+                row = self.conn.execute(f"SELECT 1 FROM tours WHERE {column} = ?", (key,)).fetchone()
+            return row is not None
+
+        paths = ", ".join("?, json(?)" for _ in updates)
+        params: List[Any] = []
+        for field, value in updates.items():
+            params.append('$."' + field.replace('"', '\\"') + '"')
+            params.append(orjson.dumps(value).decode())
+        uuid_assignment = ""
+        if 'id' in updates:
+            uuid_assignment = ", uuid = ?"
+            params.append(updates['id'])
+        params.append(key)
+
+        with self._lock:
+            cursor = self.conn.execute(
+                f"UPDATE tours SET data = json_set(CAST(data AS TEXT), {paths}){uuid_assignment} "
+                f"WHERE {column} = ?",
+                params
+            )
+        return cursor.rowcount > 0
+
+    def flush(self) -> None:
+        """
+        Persist any cached writes to disk.
+        """
+        # Every statement is committed as it runs, nothing is buffered here
+        pass
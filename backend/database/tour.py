@@ -1,18 +1,37 @@
 from typing import List, Optional, Dict, Any, cast
-from tinydb import Query
 from database.database_base import DatabaseBase
 
 class TourRepository:
     def __init__(self, db_base: DatabaseBase):
+        self.db_base = db_base
         self.db = db_base.get_db()
-        self.table = self.db.table('tours')
+        self.table = self.db.table('tours', cache_size=1000)
+        # Secondary index mapping tour UUID -> TinyDB document ID, so UUID
+        # lookups avoid a full table scan
+        self._uuid_index: Dict[str, int] = {
+            doc['id']: doc.doc_id for doc in self.table.all() if 'id' in doc
+        }
 
     def add_tour(self, tour_data: Dict[str, Any]) -> int:
         """
         Add a new tour to the database.
         Returns the inserted document ID.
         """
-        return self.table.insert(tour_data)
+        doc_id = self.table.insert(tour_data)
+        if 'id' in tour_data:
+            self._uuid_index[tour_data['id']] = doc_id
+        return doc_id
+
+    def add_tours(self, tours: List[Dict[str, Any]]) -> List[int]:
+        """
+        Add several tours in a single table write.
+        Returns the inserted document IDs, in input order.
+        """
+        doc_ids = self.table.insert_multiple(tours)
+        for tour_data, doc_id in zip(tours, doc_ids):
+            if 'id' in tour_data:
+                self._uuid_index[tour_data['id']] = doc_id
+        return doc_ids
 
     def get_tour(self, tour_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -28,36 +47,50 @@ class TourRepository:
         """
         Get a tour by its UUID.
         """
-        Tour = Query()
-        results = self.table.search(Tour.id == tour_uuid)
-        if not results:
+        doc_id = self._uuid_index.get(tour_uuid)
+        if doc_id is None:
             return None
-        # Return the first matching tour
-        return cast(Dict[str, Any], results[0])
+        return self.get_tour(doc_id)
 
     def list_tours(self) -> List[Dict[str, Any]]:
         """
         List all tours in the database.
         """
-        # Document is a dict subclass, cast to Dict for type checker
-        return [cast(Dict[str, Any], doc) for doc in self.table.all()]
+        # Document is a dict subclass; return TinyDB's list as-is instead of copying it
+        return self.table.all()  # type: ignore[return-value]
     
     def update_tour(self, tour_id: int, updates: Dict[str, Any]) -> None:
         """
         Update a tour by its ID.
         """
         self.table.update(updates, doc_ids=[tour_id])
+        self._reindex(tour_id, updates)
 
     def update_tour_by_uuid(self, tour_uuid: str, updates: Dict[str, Any]) -> bool:
         """
         Update a tour by its UUID.
         Returns True if updated, False if tour not found.
         """
-        Tour = Query()
-        results = self.table.search(Tour.id == tour_uuid)
-        if not results:
+        doc_id = self._uuid_index.get(tour_uuid)
+        if doc_id is None:
             return False
-        # Update using the document ID
-        doc_id = results[0].doc_id
         self.table.update(updates, doc_ids=[doc_id])
+        self._reindex(doc_id, updates)
         return True
+
+    def _reindex(self, doc_id: int, updates: Dict[str, Any]) -> None:
+        """
+        Keep the UUID index in sync when an update changes a tour's UUID.
+        """
+        if 'id' not in updates:
+            return
+        for tour_uuid, indexed_doc_id in list(self._uuid_index.items()):
+            if indexed_doc_id == doc_id:
+                del self._uuid_index[tour_uuid]
+        self._uuid_index[updates['id']] = doc_id
+
+    def flush(self) -> None:
+        """
+        Persist any cached writes to disk.
+        """
+        self.db_base.flush()
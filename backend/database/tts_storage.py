@@ -1,20 +1,25 @@
-from typing import Optional
-from tinydb import Query
+from typing import Dict, Optional, Tuple
 from database.database_base import DatabaseBase
 
 class TTSRepository:
     def __init__(self, db_base: DatabaseBase):
+        self.db_base = db_base
         self.db = db_base.get_db()
-        self.table = self.db.table('tts_cache')
+        self.table = self.db.table('tts_cache', cache_size=5000)
+        # Secondary index mapping text hash -> (document ID, file path), so cache
+        # lookups are a dict hit instead of a table scan
+        self._hash_index: Dict[str, Tuple[int, str]] = {
+            doc['text_hash']: (doc.doc_id, doc.get('file_path'))
+            for doc in self.table.all() if 'text_hash' in doc
+        }
 
     def get_audio_path(self, text_hash: str) -> Optional[str]:
         """
         Retrieve the file path for a given text hash.
         """
-        TTS = Query()
-        result = self.table.search(TTS.text_hash == text_hash)
-        if result:
-            return result[0].get('file_path')
+        entry = self._hash_index.get(text_hash)
+        if entry:
+            return entry[1]
         return None
 
     def save_audio_path(self, text_hash: str, file_path: str) -> int:
@@ -23,13 +28,22 @@ class TTSRepository:
         Returns the inserted document ID.
         """
         # Check if it already exists to avoid duplicates
-        TTS = Query()
-        existing = self.table.search(TTS.text_hash == text_hash)
-        if existing:
-            self.table.update({'file_path': file_path}, doc_ids=[existing[0].doc_id])
-            return existing[0].doc_id
-        
-        return self.table.insert({
+        entry = self._hash_index.get(text_hash)
+        if entry:
+            doc_id = entry[0]
+            if entry[1] == file_path:
+                # Same mapping already stored, skip the write
+                return doc_id
+            self.table.update({'file_path': file_path}, doc_ids=[doc_id])
+            self._hash_index[text_hash] = (doc_id, file_path)
+            self.db_base.flush()
+            return doc_id
+
+        doc_id = self.table.insert({
             'text_hash': text_hash,
             'file_path': file_path
         })
+        self._hash_index[text_hash] = (doc_id, file_path)
+        # Audio files are expensive to regenerate, persist the mapping right away
+        self.db_base.flush()
+        return doc_id
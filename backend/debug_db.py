@@ -1,5 +1,6 @@
 import sys
 import os
+from itertools import islice
 
 # Add backend to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -29,11 +30,10 @@ def test_db_read():
     else:
         print("❌ Tour NOT FOUND in DB via Repository.")
         
-        # List all IDs
-        print("Listing all IDs in DB:")
-        all_tours = repo.tours_table.all()
-        for t in all_tours:
-            print(f" - {t.get('id')}")
+        # List known IDs from the UUID index, without reading every document
+        print("Listing first 20 IDs in DB:")
+        for tour_id in islice(repo._uuid_index, 20):
+            print(f" - {tour_id}")
 
 if __name__ == "__main__":
     test_db_read()
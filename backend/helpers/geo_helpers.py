@@ -0,0 +1,44 @@
+"""
+Helper functions for geographic calculations.
+
+This module contains utility functions for estimating distances between
+coordinates without calling the Google Maps APIs.
+"""
+
+from math import asin, cos, radians, sin, sqrt
+from typing import List, Tuple
+
+# Mean Earth radius in kilometers
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(origin: Tuple[float, float], destination: Tuple[float, float]) -> float:
+    """
+    Calculate the great-circle distance between two points.
+
+    Args:
+        origin: (latitude, longitude) of the first point
+        destination: (latitude, longitude) of the second point
+
+    Returns:
+        Distance in kilometers
+    """
+    lat1, lng1 = map(radians, origin)
+    lat2, lng2 = map(radians, destination)
+    a = sin((lat2 - lat1) / 2) ** 2 + cos(lat1) * cos(lat2) * sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * asin(sqrt(a))
+
+
+def path_length_km(points: List[Tuple[float, float]]) -> float:
+    """
+    Calculate the straight-line length of a path visiting the points in order.
+
+    This is a lower bound for the distance of any route along the same stops.
+
+    Args:
+        points: List of (latitude, longitude) pairs
+
+    Returns:
+        Total distance in kilometers
+    """
+    return sum(haversine_km(a, b) for a, b in zip(points, points[1:]))
@@ -5,13 +5,32 @@ This module contains utility functions for parsing time and distance constraints
 used in tour generation and validation.
 """
 
+import re
+from functools import lru_cache
 
+# A number followed by its unit, e.g. "2.5 hours" or "500m"; the first match is used
+_TIME_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(hours?|hrs?|minutes?|mins?|days?)', re.IGNORECASE)
+_DISTANCE_RE = re.compile(
+    r'(\d+(?:\.\d+)?)\s*(km|kilomet(?:er|re)s?|miles?|mi\b|met(?:er|re)s?|m\b)',
+    re.IGNORECASE
+)
+
+# Conversion factors keyed by the first letter (time) or two letters (distance) of the unit
+_MINUTES_PER_UNIT = {'h': 60, 'm': 1, 'd': 24 * 60}
+_KM_PER_UNIT = {'km': 1.0, 'ki': 1.0, 'mi': 1.60934, 'me': 0.001, 'm': 0.001}
+
+# Clients send a handful of recurring constraint strings ("2 hours", "5 km", ...)
+PARSE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_time_to_minutes(time_str: str) -> int:
     """
     Parse a time string to minutes.
     
     Supports various formats:
     - "2 hours" or "2 hour" -> 120 minutes
+    - "2 hr" or "2 hrs" -> 120 minutes
     - "30 min" or "30 minutes" -> 30 minutes
     - "1 day" or "1 days" -> 1440 minutes
     
@@ -25,18 +44,14 @@ def parse_time_to_minutes(time_str: str) -> int:
         # If already a number, assume it's already in minutes
         return int(time_str) if time_str else 120
     
-    time_lower = time_str.lower()
-    if 'hour' in time_lower:
-        hours = float(''.join(filter(lambda x: x.isdigit() or x == '.', time_lower.split('hour')[0])))
-        return int(hours * 60)
-    elif 'min' in time_lower:
-        return int(''.join(filter(str.isdigit, time_lower)))
-    elif 'day' in time_lower:
-        days = float(''.join(filter(lambda x: x.isdigit() or x == '.', time_lower.split('day')[0])))
-        return int(days * 24 * 60)
-    return 120  # Default 2 hours
+    match = _TIME_RE.search(time_str)
+    if not match:
+        return 120  # Default 2 hours
+    value, unit = match.groups()
+    return int(float(value) * _MINUTES_PER_UNIT[unit[0].lower()])
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_distance_to_km(distance_str: str) -> float:
     """
     Parse a distance string to kilometers.
@@ -56,13 +71,8 @@ def parse_distance_to_km(distance_str: str) -> float:
         # If already a number, assume it's already in km
         return float(distance_str) if distance_str else 5.0
     
-    distance_lower = distance_str.lower()
-    if 'km' in distance_lower or 'kilometer' in distance_lower:
-        return float(''.join(filter(lambda x: x.isdigit() or x == '.', distance_lower.split('km')[0])))
-    elif 'mile' in distance_lower:
-        miles = float(''.join(filter(lambda x: x.isdigit() or x == '.', distance_lower.split('mile')[0])))
-        return miles * 1.60934
-    elif 'm' in distance_lower and 'km' not in distance_lower:
-        meters = float(''.join(filter(str.isdigit, distance_lower)))
-        return meters / 1000
-    return 5.0  # Default 5 km
+    match = _DISTANCE_RE.search(distance_str)
+    if not match:
+        return 5.0  # Default 5 km
+    value, unit = match.groups()
+    return float(value) * _KM_PER_UNIT[unit[:2].lower()]
@@ -1,23 +1,69 @@
+import asyncio
+import atexit
 import logging
-from fastapi import FastAPI, APIRouter
+import queue
+import sys
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
+from fastapi import FastAPI, APIRouter, Response
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+# Configure logging. Records are handed to a background thread through a queue, so
+# request handlers (e.g. a burst of concurrent POI verifications) never block on stdout
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_output = logging.StreamHandler()
+_log_output.setFormatter(logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
-)
+))
+_log_enqueue = QueueHandler(_log_queue)
+# Only merge the message arguments here; the output handler applies the real format
+_log_enqueue.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_log_enqueue])
+_log_listener = QueueListener(_log_queue, _log_output)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 from routes import tts, tour
+from database.database_base import get_database_base
+from services.gemini_service import configure_gemini
+from services.maps_service import close_http_client, configure_maps
+
+# Threads for the blocking SDK calls (Gemini, googlemaps) offloaded with asyncio.to_thread.
+# Gemini calls hold a thread for seconds, so the pool is larger than asyncio's CPU-based default
+BLOCKING_IO_THREADS = 32
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=BLOCKING_IO_THREADS, thread_name_prefix="blocking-io")
+    )
+    # Fail fast on a missing GEMINI_API_KEY instead of on the first Gemini request
+    configure_gemini()
+    # Same for GOOGLE_MAPS_API_KEY
+    configure_maps()
+    build_root_payload(app)
+    yield
+    try:
+        # Write out any tour/TTS changes still held in the TinyDB write cache
+        get_database_base().flush()
+    finally:
+        # Release the pooled connections of the shared Maps HTTP client
+        await close_http_client()
+
 
 app = FastAPI(
     title="Jorian Flow Tour API",
     description="API for generating thematic tour options based on location",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware configuration
@@ -39,20 +85,24 @@ api_v1_router.include_router(tour.router, tags=["Tour"])
 # Mount the v1 API router
 app.include_router(api_v1_router)
 
+# Static JSON payloads are encoded once and served as raw bytes
+_HEALTH_RESPONSE = orjson.dumps({"status": "healthy"})
+
+
 # Expose OpenAPI schema at /api/v1/openapi.json
 @app.get("/api/v1/openapi.json", include_in_schema=False)
 async def openapi_json():
     from fastapi.openapi.utils import get_openapi
-    if app.openapi_schema:
-        return app.openapi_schema
-    openapi_schema = get_openapi(
-        title=app.title,
-        version=app.version,
-        description=app.description,
-        routes=app.routes,
-    )
-    app.openapi_schema = openapi_schema
-    return openapi_schema
+    if not hasattr(app.state, "openapi_json"):
+        if not app.openapi_schema:
+            app.openapi_schema = get_openapi(
+                title=app.title,
+                version=app.version,
+                description=app.description,
+                routes=app.routes,
+            )
+        app.state.openapi_json = orjson.dumps(app.openapi_schema)
+    return Response(content=app.state.openapi_json, media_type="application/json")
 
 
 def get_endpoints_from_routes(app: FastAPI) -> dict:
@@ -110,31 +160,43 @@ def get_endpoints_from_routes(app: FastAPI) -> dict:
     return endpoints
 
 
-@app.get("/")
-async def root():
-    endpoints = get_endpoints_from_routes(app)
-    return {
+def build_root_payload(app: FastAPI) -> None:
+    # The route table is fixed once the app starts, so the endpoint listing is built once,
+    # kept read-only for other readers, and pre-encoded for the root endpoint
+    app.state.endpoints = MappingProxyType({
+        sys.intern(path): sys.intern(description)
+        for path, description in get_endpoints_from_routes(app).items()
+    })
+    app.state.root_payload = orjson.dumps({
         "message": "Welcome to Jorian Flow Tour API",
         "version": app.version,
-        "endpoints": endpoints
-    }
+        "endpoints": dict(app.state.endpoints)
+    })
+
+
+@app.get("/")
+async def root():
+    return Response(content=app.state.root_payload, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_RESPONSE, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
-    # Use loop="asyncio" explicitly to ensure proper async behavior
-    # This ensures BackgroundTasks work correctly and don't block the response
+    # loop/http "auto" pick uvloop and httptools (installed with uvicorn[standard]),
+    # falling back to asyncio/h11 where they are unavailable
     uvicorn.run(
         app, 
         host="0.0.0.0", 
         port=8000, 
         log_level="debug", 
-        access_log=True,
-        loop="asyncio",  # Explicitly use asyncio event loop for proper async support
-        workers=1  # Use single worker to ensure BackgroundTasks work correctly
+        access_log=False,  # Per-request access logging is synchronous, keep it off the hot path
+        loop="auto",
+        http="auto",
+        # Single worker: the TinyDB write cache, the UUID/TTS indexes and the response caches
+        # live in process memory, so several workers would overwrite each other's DB writes
+        workers=1
     )
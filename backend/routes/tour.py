@@ -1,15 +1,17 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Header, Request, Response
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import Dict, List, Optional
 from uuid import UUID, uuid4
 import logging
-import os
 import httpx
+import orjson
+from cachetools import TTLCache
 from services.gemini_service import generate_theme_options, validate_user_request_guardrail, generate_narrative_stories, generate_tour_introduction
-from services.maps_service import get_address_from_coordinates
-from database.database_base import DatabaseBase
-from database.tour import TourRepository
+from services.maps_service import get_address_from_coordinates, fetch_place_photo
+from database.database_base import get_database_base
+from database.factory import create_tour_repository
 from services.poi_service import POIService
 from services.tour_service import TourService
 from services.tour_orchestration_service import TourOrchestrationService
@@ -18,15 +20,55 @@ from services.tour_orchestration_service import TourOrchestrationService
 logger = logging.getLogger(__name__)
 
 
-router = APIRouter()
+class _OrjsonRequest(Request):
+    """Request whose JSON body is parsed with orjson instead of the stdlib json module."""
+
+    async def json(self):
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class _OrjsonRoute(APIRoute):
+    """
+    Route parsing JSON request bodies with orjson.
+
+    Responses are untouched: routes with a response_model are already serialized by
+    Pydantic, and the others go through _json_response.
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def orjson_handler(request: Request) -> Response:
+            return await handler(_OrjsonRequest(request.scope, request.receive))
+
+        return orjson_handler
+
+
+router = APIRouter(route_class=_OrjsonRoute)
 
 # Initialize Repository and Services
-db_base = DatabaseBase("database/db.json")
-tour_repo = TourRepository(db_base)
+db_base = get_database_base()
+tour_repo = create_tour_repository(db_base)
 tour_service = TourService(tour_repo)
 poi_service = POIService()
 tour_orchestration_service = TourOrchestrationService(poi_service, tour_service)
 
+def _json_response(payload: Dict) -> Response:
+    """
+    Serialize a server-built payload with orjson, skipping response model validation.
+
+    Endpoints using this declare their model via `responses` so the OpenAPI docs are unchanged.
+    """
+    return Response(content=orjson.dumps(payload), media_type="application/json")
+
+
+# Theme suggestions per normalized address, so repeat lookups skip the Gemini call
+THEME_CACHE_SIZE = 1024
+THEME_CACHE_TTL_SECONDS = 3600
+_theme_cache: TTLCache = TTLCache(maxsize=THEME_CACHE_SIZE, ttl=THEME_CACHE_TTL_SECONDS)
+
 
 async def process_tour_generation_background(
     transaction_id: str,
@@ -61,7 +103,7 @@ async def process_tour_generation_background(
     try:
         # First, create the tour record in the database
         # This ensures it exists before any subsequent operations try to read it
-        tour_service.create_tour(
+        await tour_service.create_tour(
             transaction_id=transaction_id,
             user_address=user_address,
             theme=custom_message,
@@ -86,7 +128,7 @@ async def process_tour_generation_background(
     except Exception as e:
         logger.error(f"❌ Error in background tour generation for {transaction_id}: {str(e)}")
         logger.exception(e)
-        tour_service.mark_tour_failed(transaction_id, str(e))
+        await tour_service.mark_tour_failed(transaction_id, str(e))
 
 
 class ThemeOptionsRequest(BaseModel):
@@ -95,22 +137,25 @@ class ThemeOptionsRequest(BaseModel):
     longitude: Optional[float] = None
     use_dummy_data: bool = False
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        strict=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "address": "Orchard Road, Singapore",
                 "latitude": 1.3048,
                 "longitude": 103.8318
             }
         }
+    )
 
 
 class ThemeOptionsResponse(BaseModel):
     themes: List[str]
     address: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "themes": [
                     "🏛️ Historical Heritage Walk",
@@ -121,6 +166,7 @@ class ThemeOptionsResponse(BaseModel):
                 "address": "Orchard Road, Singapore"
             }
         }
+    )
 
 
 class POIConstraints(BaseModel):
@@ -128,23 +174,30 @@ class POIConstraints(BaseModel):
     distance: str
     user_custom_info: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        strict=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "time": "2 hours",
                 "distance": "5 km",
                 "user_custom_info": "I love historical sites and local food"
             }
         }
+    )
 
 
 class GeneratePOIRequest(BaseModel):
     latitude: float
     longitude: float
     constraints: POIConstraints
+    # Address already resolved by /theme_options; skips the reverse-geocoding call
+    address: Optional[str] = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        strict=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "latitude": 1.3048,
                 "longitude": 103.8318,
@@ -155,6 +208,7 @@ class GeneratePOIRequest(BaseModel):
                 }
             }
         }
+    )
 
 
 from schemas.tour import Tour, POI
@@ -165,21 +219,26 @@ class IntermediatePOI(BaseModel):
     poi_title: str
     address: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "poi_title": "Singapore Botanic Gardens",
                 "address": "1 Cluny Rd, Singapore 259569"
             }
         }
+    )
+
+
+# List validators built once, so converting a POI list is a single pydantic-core call
+_POI_LIST = TypeAdapter(List[POI])
 
 
 class GeneratePOIResponse(BaseModel):
     user_address: str
     pois: List[IntermediatePOI]
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "user_address": "Orchard Road, Singapore",
                 "pois": [
@@ -194,14 +253,17 @@ class GeneratePOIResponse(BaseModel):
                 ]
             }
         }
+    )
 
 
 class FilterPOIRequest(BaseModel):
     transaction_id: str
     pois: List[POI]
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        strict=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "transaction_id": "550e8400-e29b-41d4-a716-446655440000",
                 "pois": [
@@ -220,6 +282,7 @@ class FilterPOIRequest(BaseModel):
                 ]
             }
         }
+    )
 
 
 class FilterPOIResponse(BaseModel):
@@ -227,8 +290,8 @@ class FilterPOIResponse(BaseModel):
     total_input: int
     total_verified: int
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "verified_pois": [
                     {
@@ -244,6 +307,7 @@ class FilterPOIResponse(BaseModel):
                 "total_verified": 2
             }
         }
+    )
 
 
 class GuardrailConstraints(BaseModel):
@@ -252,8 +316,10 @@ class GuardrailConstraints(BaseModel):
     custom: str
     address: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        strict=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "max_time": "3 hours",
                 "distance": "10 km",
@@ -261,13 +327,16 @@ class GuardrailConstraints(BaseModel):
                 "address": "Orchard Road, Singapore"
             }
         }
+    )
 
 
 class GuardrailRequest(BaseModel):
     constraints: GuardrailConstraints
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        strict=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "constraints": {
                     "max_time": "3 hours",
@@ -277,19 +346,21 @@ class GuardrailRequest(BaseModel):
                 }
             }
         }
+    )
 
 
 class GuardrailResponse(BaseModel):
     transaction_id: str
     valid: bool
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "transaction_id": "550e8400-e29b-41d4-a716-446655440000",
                 "valid": True
             }
         }
+    )
 
 
 
@@ -298,12 +369,15 @@ class GuardrailResponse(BaseModel):
 class GenerateTourRequest(BaseModel):
     transaction_id: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        strict=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "transaction_id": "e3d6b790-4604-4570-8fde-c7d278c1ad9e"
             }
         }
+    )
 
 
 class GenerateTourResponse(BaseModel):
@@ -312,8 +386,8 @@ class GenerateTourResponse(BaseModel):
     message: str
     pois_count: int
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "transaction_id": "550e8400-e29b-41d4-a716-446655440000",
                 "success": True,
@@ -321,14 +395,17 @@ class GenerateTourResponse(BaseModel):
                 "pois_count": 5
             }
         }
+    )
 
 
 class GenerateStoryRequest(BaseModel):
     transaction_id: str
     pois: List[POI]
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        strict=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "transaction_id": "550e8400-e29b-41d4-a716-446655440000",
                 "pois": [
@@ -341,6 +418,7 @@ class GenerateStoryRequest(BaseModel):
                 ]
             }
         }
+    )
 
 
 class GenerateStoryResponse(BaseModel):
@@ -349,8 +427,8 @@ class GenerateStoryResponse(BaseModel):
     stories_generated: int
     updated_pois: List[POI]
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "transaction_id": "550e8400-e29b-41d4-a716-446655440000",
                 "success": True,
@@ -358,14 +436,17 @@ class GenerateStoryResponse(BaseModel):
                 "updated_pois": []
             }
         }
+    )
 
 
 class GenerateIntroductionRequest(BaseModel):
     transaction_id: str
     pois: List[POI]
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        strict=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "transaction_id": "550e8400-e29b-41d4-a716-446655440000",
                 "pois": [
@@ -378,6 +459,7 @@ class GenerateIntroductionRequest(BaseModel):
                 ]
             }
         }
+    )
 
 
 class GenerateIntroductionResponse(BaseModel):
@@ -385,17 +467,18 @@ class GenerateIntroductionResponse(BaseModel):
     success: bool
     introduction: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "transaction_id": "550e8400-e29b-41d4-a716-446655440000",
                 "success": True,
                 "introduction": "Welcome to your historical tour of Singapore! Get ready to explore..."
             }
         }
+    )
 
 
-@router.post("/theme_options", response_model=ThemeOptionsResponse)
+@router.post("/theme_options", response_model=None, responses={200: {"model": ThemeOptionsResponse}})
 async def get_theme_options(request: ThemeOptionsRequest):
     """
     Generate thematic tour options for a given location address or coordinates.
@@ -415,28 +498,32 @@ async def get_theme_options(request: ThemeOptionsRequest):
         if request.address:
             geocoded_address = request.address
         elif request.latitude is not None and request.longitude is not None:
-            geocoded_address = get_address_from_coordinates(request.latitude, request.longitude)
+            geocoded_address = await get_address_from_coordinates(request.latitude, request.longitude)
         else:
             raise ValueError("Either address or coordinates must be provided")
         
         if request.use_dummy_data:
-            return ThemeOptionsResponse(
-                themes=[
+            return _json_response({
+                "themes": [
                     "🏛️ Historical Heritage Walk",
                     "🛍️ Shopping & Fashion Tour",
                     "🎨 Cultural Fusion Experience",
                     "🍜 Foodie's Paradise Tour"
                 ],
-                address=geocoded_address or "Orchard Road, Singapore"
+                "address": geocoded_address or "Orchard Road, Singapore"
+            })
+
+        cache_key = geocoded_address.strip().casefold()
+        themes = _theme_cache.get(cache_key)
+        if themes is None:
+            # Generate themes using the geocoded address (service will use it directly since we provide it)
+            themes = await generate_theme_options(
+                address=geocoded_address,
+                latitude=None,
+                longitude=None
             )
-
-        # Generate themes using the geocoded address (service will use it directly since we provide it)
-        themes = await generate_theme_options(
-            address=geocoded_address,
-            latitude=None,
-            longitude=None
-        )
-        return ThemeOptionsResponse(themes=themes, address=geocoded_address)
+            _theme_cache[cache_key] = themes
+        return _json_response({"themes": themes, "address": geocoded_address})
     except ValueError as e:
         raise HTTPException(
             status_code=400,
@@ -449,13 +536,14 @@ async def get_theme_options(request: ThemeOptionsRequest):
         )
 
 
-@router.post("/generate_poi", response_model=GeneratePOIResponse)
+@router.post("/generate_poi", response_model=None, responses={200: {"model": GeneratePOIResponse}})
 async def generate_poi_endpoint(request: GeneratePOIRequest):
     """
     Generate Points of Interest (POIs) based on user coordinates and constraints.
 
     This endpoint performs two steps:
     1. Converts latitude/longitude to address using Google Maps Geocoding API
+       (skipped when the request already carries the address)
     2. Generates relevant POIs using Gemini API based on the address and constraints
 
     Args:
@@ -468,11 +556,16 @@ async def generate_poi_endpoint(request: GeneratePOIRequest):
         HTTPException: If there's an error in geocoding or POI generation
     """
     try:
-        # Step 1: Convert coordinates to address using Google Maps API
-        user_address = get_address_from_coordinates(
-            request.latitude,
-            request.longitude
-        )
+        # Step 1: Convert coordinates to address using Google Maps API.
+        # Gemini needs the address, so a known address saves the whole round trip.
+        # Both steps are awaited without blocking the event loop; they stay sequential
+        # because the POI prompt is built from the resolved address
+        user_address = request.address
+        if not user_address:
+            user_address = await get_address_from_coordinates(
+                request.latitude,
+                request.longitude
+            )
 
         # Step 2: Generate POIs using Gemini API
         pois_data = await poi_service.generate_pois(
@@ -482,21 +575,12 @@ async def generate_poi_endpoint(request: GeneratePOIRequest):
             user_custom_info=request.constraints.user_custom_info
         )
 
-        # Convert to intermediate POI model objects
-        # Note: generate_pois returns dicts with 'poi_title' and 'address' keys
-        pois = []
-        for poi_data_item in pois_data:
-            # Handle both 'address' and 'poi_address' keys for compatibility
-            address = poi_data_item.get('address') or poi_data_item.get('poi_address', '')
-            pois.append(IntermediatePOI(
-                poi_title=poi_data_item.get('poi_title', ''),
-                address=address
-            ))
-
-        return GeneratePOIResponse(
-            user_address=user_address,
-            pois=pois
-        )
+        # generate_pois already validated every dict against the POI schema
+        # ('poi_title' and 'address'), so the payload is returned as is
+        return _json_response({
+            "user_address": user_address,
+            "pois": pois_data
+        })
 
     except ValueError as e:
         raise HTTPException(
@@ -510,16 +594,42 @@ async def generate_poi_endpoint(request: GeneratePOIRequest):
         )
 
 
-@router.post("/filter_poi", response_model=FilterPOIResponse)
-async def filter_poi_endpoint(request: FilterPOIRequest):
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def _stream_filtered_pois(request: FilterPOIRequest):
+    """
+    Yield each verified POI as an NDJSON line as soon as it is verified, then a summary line.
+
+    The filtered POIs are stored in input order once every lookup has completed.
+    """
+    verified: Dict[int, Dict] = {}
+    async for index, poi in poi_service.iter_verified_poi_models(request.pois):
+        verified[index] = poi.model_dump()
+        yield orjson.dumps(verified[index]) + b"\n"
+
+    tour_service.update_filtered_pois(
+        request.transaction_id,
+        [verified[index] for index in sorted(verified)]
+    )
+    yield orjson.dumps({"total_input": len(request.pois), "total_verified": len(verified)}) + b"\n"
+
+
+@router.post("/filter_poi", response_model=None, responses={200: {"model": FilterPOIResponse}})
+async def filter_poi_endpoint(request: FilterPOIRequest, accept: Optional[str] = Header(None)):
     """
     Filter and verify POIs to check if they actually exist in reality.
 
     This endpoint uses Google Maps Places API to verify each POI.
     Only POIs that are found and verified are included in the response.
 
+    Clients sending `Accept: application/x-ndjson` get a streamed response instead:
+    one line per verified POI as soon as it is verified, followed by a
+    `{"total_input": ..., "total_verified": ...}` line.
+
     Args:
         request: FilterPOIRequest containing a list of POIs to verify
+        accept: Accept header, selects the streamed NDJSON response
 
     Returns:
         FilterPOIResponse with verified POIs and statistics
@@ -528,32 +638,37 @@ async def filter_poi_endpoint(request: FilterPOIRequest):
         HTTPException: If there's an error during verification
     """
     try:
-        # Convert POI models to dictionaries for verification
-        pois_dict = [poi.model_dump() for poi in request.pois]
-
         # Get total input count
-        total_input = len(pois_dict)
+        total_input = len(request.pois)
+
+        # Nothing to verify: record the empty list without touching Google Maps
+        if not total_input:
+            tour_service.update_filtered_pois(request.transaction_id, [])
+            return _json_response({"verified_pois": [], "total_input": 0, "total_verified": 0})
 
-        # Verify POIs using Google Maps Places API
-        verified_pois_dict = poi_service.verify_pois(pois_dict)
+        if accept and NDJSON_MEDIA_TYPE in accept:
+            return StreamingResponse(_stream_filtered_pois(request), media_type=NDJSON_MEDIA_TYPE)
 
-        # Convert verified POIs back to POI model objects
-        verified_pois = [POI(**poi) for poi in verified_pois_dict]
+        # Verify the POI models directly using Google Maps
+        verified_pois = await poi_service.verify_poi_models(request.pois)
 
         # Get total verified count
         total_verified = len(verified_pois)
 
+        # Only the verified POIs are dumped, once, for both storage and the response
+        verified_pois_dict = _POI_LIST.dump_python(verified_pois)
+
         # Update tour with filtered POIs
         tour_service.update_filtered_pois(
             request.transaction_id,
-            [poi.model_dump() for poi in verified_pois]
+            verified_pois_dict
         )
 
-        return FilterPOIResponse(
-            verified_pois=verified_pois,
-            total_input=total_input,
-            total_verified=total_verified
-        )
+        return _json_response({
+            "verified_pois": verified_pois_dict,
+            "total_input": total_input,
+            "total_verified": total_verified
+        })
 
     except ValueError as e:
         raise HTTPException(
@@ -767,7 +882,7 @@ async def generate_introduction_endpoint(request: GenerateIntroductionRequest):
         theme = tour_data.get('theme', constraints.get('custom', 'Standard Tour'))
         
         # Convert POIs to dicts for processing
-        pois_dicts = [poi.model_dump() for poi in request.pois]
+        pois_dicts = _POI_LIST.dump_python(request.pois)
         
         # Generate introduction using Gemini
         introduction = await generate_tour_introduction(
@@ -776,12 +891,9 @@ async def generate_introduction_endpoint(request: GenerateIntroductionRequest):
         )
         
         # Update the tour in database with the introduction
-        tour_data = tour_service.tour_repo.update_tour_by_uuid(
-            tour_uuid=request.transaction_id,
-            updates={"introduction": introduction}
-        )
+        updated = tour_service.update_tour_introduction(request.transaction_id, introduction)
         
-        if not tour_data:
+        if not updated:
             raise HTTPException(
                 status_code=500,
                 detail="Failed to update tour introduction in database"
@@ -833,7 +945,7 @@ async def generate_story_endpoint(request: GenerateStoryRequest):
         theme = tour_data.get('theme', constraints.get('custom', 'Standard Tour'))
         
         # Convert POIs to dicts for processing
-        pois_dicts = [poi.model_dump() for poi in request.pois]
+        pois_dicts = _POI_LIST.dump_python(request.pois)
         
         # Generate stories using Gemini
         # The service handles removing sensitive fields (gps_location, etc.) before prompt
@@ -851,15 +963,14 @@ async def generate_story_endpoint(request: GenerateStoryRequest):
                 detail="Failed to update tour in database"
             )
             
-        # Convert back to POI models
-        updated_pois = [POI(**p) for p in updated_pois_dicts]
-        
-        return GenerateStoryResponse(
-            transaction_id=request.transaction_id,
-            success=True,
-            stories_generated=len(updated_pois),
-            updated_pois=updated_pois
-        )
+        # The response_model validates the POIs once on the way out,
+        # so they are not rebuilt as models here first
+        return {
+            "transaction_id": request.transaction_id,
+            "success": True,
+            "stories_generated": len(updated_pois_dicts),
+            "updated_pois": updated_pois_dicts
+        }
 
     except HTTPException:
         raise
@@ -871,6 +982,71 @@ async def generate_story_endpoint(request: GenerateStoryRequest):
         )
 
 
+# Sample Singapore POIs served for dummy tours, validated once at import
+_DUMMY_SINGAPORE_POIS = _POI_LIST.validate_python([
+    {
+        "order": 1,
+        "poi_title": "Marina Bay Sands",
+        "google_place_id": "ChIJt1rLykIW2jER5iQeQJONKzY",
+        "google_place_img_url": None,
+        "address": "10 Bayfront Ave, Singapore 018956",
+        "google_maps_name": "Marina Bay Sands",
+        "story": "An iconic integrated resort featuring a hotel, casino, shopping mall, and the famous SkyPark with an infinity pool overlooking Singapore's skyline.",
+        "pin_image_url": None,
+        "story_keywords": "architecture, luxury, skyline, iconic",
+        "gps_location": {
+            "lat": 1.2839,
+            "lng": 103.8608
+        }
+    },
+    {
+        "order": 2,
+        "poi_title": "Gardens by the Bay",
+        "google_place_id": "ChIJ-1rLykIW2jER5iQeQJONKzY",
+        "google_place_img_url": None,
+        "address": "18 Marina Gardens Dr, Singapore 018953",
+        "google_maps_name": "Gardens by the Bay",
+        "story": "A nature park spanning 101 hectares of reclaimed land, featuring the stunning Supertree Grove and climate-controlled conservatories showcasing plants from around the world.",
+        "pin_image_url": None,
+        "story_keywords": "nature, gardens, architecture, sustainability",
+        "gps_location": {
+            "lat": 1.2816,
+            "lng": 103.8636
+        }
+    },
+    {
+        "order": 3,
+        "poi_title": "Merlion Park",
+        "google_place_id": "ChIJt1rLykIW2jER5iQeQJONKzY",
+        "google_place_img_url": None,
+        "address": "1 Fullerton Rd, Singapore 049213",
+        "google_maps_name": "Merlion Park",
+        "story": "Home to Singapore's iconic Merlion statue, a mythical creature with the head of a lion and body of a fish, symbolizing Singapore's origin as a fishing village.",
+        "pin_image_url": None,
+        "story_keywords": "iconic, symbol, history, culture",
+        "gps_location": {
+            "lat": 1.2868,
+            "lng": 103.8545
+        }
+    },
+    {
+        "order": 4,
+        "poi_title": "Singapore Flyer",
+        "google_place_id": "ChIJt1rLykIW2jER5iQeQJONKzY",
+        "google_place_img_url": None,
+        "address": "30 Raffles Ave, Singapore 039803",
+        "google_maps_name": "Singapore Flyer",
+        "story": "One of the world's largest observation wheels, offering breathtaking 360-degree views of Singapore's cityscape, Marina Bay, and the surrounding islands.",
+        "pin_image_url": None,
+        "story_keywords": "observation, views, architecture, experience",
+        "gps_location": {
+            "lat": 1.2893,
+            "lng": 103.8631
+        }
+    }
+])
+
+
 @router.get("/{tour_id}/{is_dummy}", response_model=Tour)
 async def get_tour_by_id(tour_id: UUID, is_dummy: bool = False):
     """
@@ -889,95 +1065,21 @@ async def get_tour_by_id(tour_id: UUID, is_dummy: bool = False):
         HTTPException: If the tour is not found or there's an error retrieving it
     """
     try:
-        # Convert UUID to string for database lookup
-        tour_uuid_str = str(tour_id)
-        
-        # Get tour from database
-        tour_data = tour_service.get_tour(tour_uuid_str)
+        # Get the parsed tour (cached between writes, clients poll this while it is generated)
+        tour = tour_service.get_tour_model(str(tour_id))
         
-        if tour_data is None:
+        if tour is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Tour with ID {tour_id} not found"
             )
         
-        # Convert database dict to Pydantic model
-        # The database might store UUID as string, so we ensure proper conversion
-        if 'id' in tour_data:
-            tour_data['id'] = UUID(tour_data['id']) if isinstance(tour_data['id'], str) else tour_data['id']
-        
-        # Ensure pois is a list if it exists
-        if 'pois' not in tour_data:
-            tour_data['pois'] = []
-        elif tour_data['pois'] is None:
-            tour_data['pois'] = []
-        
         # If is_dummy is True, replace POIs with dummy Singapore POIs
+        # (on a copy, the cached tour is shared)
         if is_dummy:
-            tour_data['pois'] = [
-                {
-                    "order": 1,
-                    "poi_title": "Marina Bay Sands",
-                    "google_place_id": "ChIJt1rLykIW2jER5iQeQJONKzY",
-                    "google_place_img_url": None,
-                    "address": "10 Bayfront Ave, Singapore 018956",
-                    "google_maps_name": "Marina Bay Sands",
-                    "story": "An iconic integrated resort featuring a hotel, casino, shopping mall, and the famous SkyPark with an infinity pool overlooking Singapore's skyline.",
-                    "pin_image_url": None,
-                    "story_keywords": "architecture, luxury, skyline, iconic",
-                    "gps_location": {
-                        "lat": 1.2839,
-                        "lng": 103.8608
-                    }
-                },
-                {
-                    "order": 2,
-                    "poi_title": "Gardens by the Bay",
-                    "google_place_id": "ChIJ-1rLykIW2jER5iQeQJONKzY",
-                    "google_place_img_url": None,
-                    "address": "18 Marina Gardens Dr, Singapore 018953",
-                    "google_maps_name": "Gardens by the Bay",
-                    "story": "A nature park spanning 101 hectares of reclaimed land, featuring the stunning Supertree Grove and climate-controlled conservatories showcasing plants from around the world.",
-                    "pin_image_url": None,
-                    "story_keywords": "nature, gardens, architecture, sustainability",
-                    "gps_location": {
-                        "lat": 1.2816,
-                        "lng": 103.8636
-                    }
-                },
-                {
-                    "order": 3,
-                    "poi_title": "Merlion Park",
-                    "google_place_id": "ChIJt1rLykIW2jER5iQeQJONKzY",
-                    "google_place_img_url": None,
-                    "address": "1 Fullerton Rd, Singapore 049213",
-                    "google_maps_name": "Merlion Park",
-                    "story": "Home to Singapore's iconic Merlion statue, a mythical creature with the head of a lion and body of a fish, symbolizing Singapore's origin as a fishing village.",
-                    "pin_image_url": None,
-                    "story_keywords": "iconic, symbol, history, culture",
-                    "gps_location": {
-                        "lat": 1.2868,
-                        "lng": 103.8545
-                    }
-                },
-                {
-                    "order": 4,
-                    "poi_title": "Singapore Flyer",
-                    "google_place_id": "ChIJt1rLykIW2jER5iQeQJONKzY",
-                    "google_place_img_url": None,
-                    "address": "30 Raffles Ave, Singapore 039803",
-                    "google_maps_name": "Singapore Flyer",
-                    "story": "One of the world's largest observation wheels, offering breathtaking 360-degree views of Singapore's cityscape, Marina Bay, and the surrounding islands.",
-                    "pin_image_url": None,
-                    "story_keywords": "observation, views, architecture, experience",
-                    "gps_location": {
-                        "lat": 1.2893,
-                        "lng": 103.8631
-                    }
-                }
-            ]
+            tour = tour.model_copy(update={'pois': list(_DUMMY_SINGAPORE_POIS)})
         
-        return Tour(**tour_data)
+        return tour
     
     except ValueError as e:
         raise HTTPException(
@@ -1008,13 +1110,6 @@ async def get_place_photo(photo_reference: str, maxwidth: int = 800):
     Returns:
         Image data with appropriate content-type headers
     """
-    api_key = os.getenv("GOOGLE_MAPS_API_KEY")
-    if not api_key:
-        raise HTTPException(
-            status_code=500,
-            detail="Google Maps API key not configured"
-        )
-    
     if not photo_reference:
         raise HTTPException(
             status_code=400,
@@ -1022,27 +1117,27 @@ async def get_place_photo(photo_reference: str, maxwidth: int = 800):
         )
     
     try:
-        # Build the Google Maps Places Photo API URL
-        photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth={maxwidth}&photo_reference={photo_reference}&key={api_key}"
+        # Fetch the image from Google Maps API over the shared, pooled Maps client
+        response = await fetch_place_photo(photo_reference, maxwidth)
         
-        # Fetch the image from Google Maps API
-        async with httpx.AsyncClient(timeout=30.0) as http_client:
-            response = await http_client.get(photo_url, follow_redirects=True)
-            response.raise_for_status()
-            
-            # Get content type from response headers, default to jpeg
-            content_type = response.headers.get("content-type", "image/jpeg")
-            
-            # Return the image as a streaming response with proper headers
-            return StreamingResponse(
-                iter([response.content]),
-                media_type=content_type,
-                headers={
-                    "Cache-Control": "public, max-age=86400",  # Cache for 1 day
-                    "Access-Control-Allow-Origin": "*",
-                }
-            )
+        # Get content type from response headers, default to jpeg
+        content_type = response.headers.get("content-type", "image/jpeg")
+        
+        # Return the image as a streaming response with proper headers
+        return StreamingResponse(
+            iter([response.content]),
+            media_type=content_type,
+            headers={
+                "Cache-Control": "public, max-age=86400",  # Cache for 1 day
+                "Access-Control-Allow-Origin": "*",
+            }
+        )
     
+    except ValueError:
+        raise HTTPException(
+            status_code=500,
+            detail="Google Maps API key not configured"
+        )
     except httpx.HTTPError as e:
         logger.error(f"Error fetching place photo: {str(e)}")
         raise HTTPException(
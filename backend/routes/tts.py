@@ -1,16 +1,17 @@
+import asyncio
 import logging
 import os
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
 from services.tts_service import TTSService
-from database.database_base import DatabaseBase
+from database.database_base import get_database_base
 from database.tts_storage import TTSRepository
 
 router = APIRouter()
 
 # Initialize Repository and Service
-db_base = DatabaseBase("database/db.json")
+db_base = get_database_base()
 tts_repo = TTSRepository(db_base)
 tts_service = TTSService(tts_repo, audio_dir="audio")
 
@@ -52,8 +53,10 @@ async def generate_tts(request: TTSRequest):
                 url=f"/tts/audio/{existing_filename}"
             )
 
-        # Generate new audio
-        filename = tts_service.generate_audio(text)
+        # Generate new audio. The Gemini TTS call blocks for seconds, so it runs in a
+        # worker thread; the repository write stays on the event loop (TinyDB is not thread-safe)
+        filename = await asyncio.to_thread(tts_service.synthesize_audio, text)
+        tts_service.record_audio(text, filename)
 
         return TTSResponse(
             filename=filename,
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 
@@ -20,8 +20,8 @@ class POI(BaseModel):
     story_keywords: Optional[str] = Field(None, description="Keywords related to the story")
     gps_location: Optional[GPSLocation] = Field(None, description="GPS location with latitude and longitude")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "order": 1,
                 "google_place_id": "ChIJN1t_tDeuEmsRUsoyG83frY4",
@@ -37,6 +37,7 @@ class POI(BaseModel):
                 }
             }
         }
+    )
 
 
 class Tour(BaseModel):
@@ -53,8 +54,8 @@ class Tour(BaseModel):
     constraints: Optional[Dict[str, Any]] = Field(None, description="Constraints used for the tour")
     filtered_candidate_poi_list: Optional[List[POI]] = Field(None, description="List of candidate POIs after filtering")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "123e4567-e89b-12d3-a456-426614174000",
                 "user_address": "Orchard Road, Singapore",
@@ -104,3 +105,4 @@ class Tour(BaseModel):
                 ]
             }
         }
+    )
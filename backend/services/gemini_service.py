@@ -1,34 +1,30 @@
 import os
-import json
 import asyncio
+import hashlib
+import logging
+import random
+import orjson
+from collections import OrderedDict
 import google.generativeai as genai
+from cachetools import TTLCache
+from google.api_core import exceptions as google_exceptions
+from pydantic import TypeAdapter, ValidationError
 from typing import Dict, List, Optional
+from typing_extensions import TypedDict
 from services.maps_service import get_address_from_coordinates
 
+logger = logging.getLogger(__name__)
 
-def get_prompt_template(address: str) -> str:
-    """
-    Generate the prompt template for Gemini API to create thematic tour options.
 
-    Args:
-        address: The location address for which to generate tour themes
+GEMINI_MODEL_NAME = 'gemini-3-flash-preview'
 
-    Returns:
-        Formatted prompt string
-    """
-    prompt = f"""You are a creative tour guide and travel expert. Given a location address, generate 4 unique and engaging thematic tour options that visitors could experience at or near this location.
-
-Location Address: {address}
 
-Please analyze this location and suggest 4 different thematic tour options. Each theme should be creative, specific to the location's characteristics, and appeal to different types of travelers.
+# Static parts of the theme and POI prompts. They are sent as system instructions so
+# every request shares an identical prefix (eligible for Gemini's implicit context
+# caching) and only the request-specific text is rebuilt per call.
+THEME_SYSTEM_INSTRUCTION = """You are a creative tour guide and travel expert. Given a location address, generate 4 unique and engaging thematic tour options that visitors could experience at or near this location.
 
-IMPORTANT: Return ONLY a valid JSON array with the following structure, nothing else:
-[
-    "Theme Name 1",
-    "Theme Name 2",
-    "Theme Name 3",
-    "Theme Name 4"
-]
+Please analyze the location and suggest 4 different thematic tour options as a list of theme names. Each theme should be creative, specific to the location's characteristics, and appeal to different types of travelers.
 
 Guidelines:
 - Each theme name MUST start with a relevant emoji that represents the theme (e.g., "🏛️ Historical Heritage Walk", "🍜 Foodie's Paradise Tour", "🏗️ Architectural Marvels")
@@ -36,10 +32,230 @@ Guidelines:
 - Keep theme names concise but engaging (3-5 words)
 - Consider the location's history, culture, food, architecture, nature, shopping, nightlife, and local experiences
 - Make each theme distinct and appealing to different traveler interests
-- Ensure the JSON array is properly formatted with double quotes
-- Choose emojis that are relevant and help visualize the theme at a glance
+- Choose emojis that are relevant and help visualize the theme at a glance"""
+
+POI_SYSTEM_INSTRUCTION = """You are a knowledgeable local tour guide. Based on the user's current location and their constraints, recommend relevant Points of Interest (POIs) they can visit.
+
+Generate a list of POIs that match the constraints, each with a poi_title and its address. Consider the time needed to travel and visit each location.
+
+Guidelines:
+- Generate 5-10 POIs that can realistically be visited within the given time and distance constraints
+- Prioritize POIs that match the user's preferences
+- Include a variety of POI types (attractions, restaurants, parks, museums, shops, etc.) unless user preferences specify otherwise
+- Ensure each POI title is clear and descriptive
+- Provide complete, accurate addresses for each POI
+- Order POIs by relevance and proximity
+- Consider travel time between POIs when selecting them"""
+
+# Shared Gemini models, built once per process by configure_gemini()
+_MODELS: Dict[str, genai.GenerativeModel] = {}
+
+
+def configure_gemini() -> None:
+    """
+    Configure the Gemini client and build the shared models.
+
+    Called once at application startup so a missing API key fails fast instead
+    of on the first request.
+
+    Raises:
+        RuntimeError: If GEMINI_API_KEY is not set
+    """
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        raise RuntimeError("GEMINI_API_KEY not found in environment variables")
+    genai.configure(api_key=api_key)
+    _MODELS.update({
+        "default": genai.GenerativeModel(GEMINI_MODEL_NAME),
+        "themes": genai.GenerativeModel(GEMINI_MODEL_NAME, system_instruction=THEME_SYSTEM_INSTRUCTION),
+        "pois": genai.GenerativeModel(GEMINI_MODEL_NAME, system_instruction=POI_SYSTEM_INSTRUCTION),
+        # The guardrail is a yes/no classification, so GEMINI_GUARDRAIL_MODEL can point it
+        # at a cheaper model (e.g. a flash-lite variant) without affecting the other calls
+        "guardrail": genai.GenerativeModel(os.getenv("GEMINI_GUARDRAIL_MODEL", GEMINI_MODEL_NAME)),
+    })
+
+
+def _get_model(kind: str = "default") -> genai.GenerativeModel:
+    """
+    Get a shared Gemini model.
+
+    Args:
+        kind: "default", or "themes"/"pois" for the models carrying those system instructions
+
+    Raises:
+        RuntimeError: If GEMINI_API_KEY is not set
+    """
+    if not _MODELS:
+        # Outside the app (standalone scripts) there is no startup hook, configure on first use
+        configure_gemini()
+    return _MODELS[kind]
+
+
+# Response schemas for Gemini's JSON mode. The API enforces the structure, so the
+# responses need no markdown-fence stripping and the prompts need no format boilerplate.
+class _POISchema(TypedDict):
+    poi_title: str
+    address: str
+
+
+class _GuardrailSchema(TypedDict):
+    valid: bool
+    reason: str
+
+
+class _OrderedPOISchema(TypedDict):
+    original_index: int
+    poi_title: str
+    poi_address: str
+    order: int
+    story_keywords: str
+    reasoning: str
+
+
+class _OrderingSchema(TypedDict):
+    ordered_pois: List[_OrderedPOISchema]
+
+
+class _StoriesSchema(TypedDict):
+    stories: List[str]
+
+
+def _json_config(response_schema) -> genai.GenerationConfig:
+    return genai.GenerationConfig(
+        response_mime_type="application/json",
+        response_schema=response_schema
+    )
+
+
+_THEMES_CONFIG = _json_config(List[str])
+_POIS_CONFIG = _json_config(List[_POISchema])
+_GUARDRAIL_CONFIG = _json_config(_GuardrailSchema)
+_ORDERING_CONFIG = _json_config(_OrderingSchema)
+_STORIES_CONFIG = _json_config(_StoriesSchema)
+
+# Parses and validates a POI response in one pass, without an intermediate json.loads
+_POI_LIST_ADAPTER = TypeAdapter(List[_POISchema])
+
+
+# In-process LRU cache of raw Gemini responses, keyed by the SHA-256 of the prompt.
+# Only responses that parsed and validated successfully are stored.
+RESPONSE_CACHE_SIZE = 512
+_response_cache: "OrderedDict[str, str]" = OrderedDict()
+
+
+def _prompt_cache_key(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+
+
+def _get_cached_response(cache_key: str) -> Optional[str]:
+    response_text = _response_cache.get(cache_key)
+    if response_text is not None:
+        _response_cache.move_to_end(cache_key)
+    return response_text
+
+
+def _cache_response(cache_key: str, response_text: str) -> None:
+    _response_cache[cache_key] = response_text
+    _response_cache.move_to_end(cache_key)
+    if len(_response_cache) > RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+
+
+# Guardrail decisions per normalized request, so a repeated request (up to case and
+# surrounding whitespace) skips the Gemini call; only parsed decisions are stored
+GUARDRAIL_CACHE_SIZE = 10_000
+GUARDRAIL_CACHE_TTL_SECONDS = 3600
+_guardrail_cache: TTLCache = TTLCache(maxsize=GUARDRAIL_CACHE_SIZE, ttl=GUARDRAIL_CACHE_TTL_SECONDS)
+
+
+# At most this many Gemini calls run at once; bursts queue here instead of tripping rate limits
+GEMINI_MAX_CONCURRENCY = 4
+
+# Transient Gemini errors (rate limiting, overload, timeouts) are retried with
+# exponential backoff: base * 2**attempt, randomized by +/- jitter
+GEMINI_MAX_ATTEMPTS = 3
+GEMINI_RETRY_BASE_DELAY = 1.0
+GEMINI_RETRY_JITTER = 0.25
+_RETRYABLE_GEMINI_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded,
+    google_exceptions.InternalServerError,
+)
+
+_gemini_semaphore = asyncio.Semaphore(GEMINI_MAX_CONCURRENCY)
+
+
+async def _generate_content(model: genai.GenerativeModel, prompt: str, generation_config=None):
+    """
+    Call model.generate_content in a worker thread so the event loop is not blocked.
+
+    Calls are limited to GEMINI_MAX_CONCURRENCY at once, and transient errors are
+    retried up to GEMINI_MAX_ATTEMPTS times (the slot is released while waiting).
+    """
+    for attempt in range(GEMINI_MAX_ATTEMPTS):
+        try:
+            async with _gemini_semaphore:
+                return await asyncio.to_thread(model.generate_content, prompt, generation_config=generation_config)
+        except _RETRYABLE_GEMINI_ERRORS as e:
+            if attempt == GEMINI_MAX_ATTEMPTS - 1:
+                raise
+            delay = GEMINI_RETRY_BASE_DELAY * 2 ** attempt * (1 + random.uniform(-GEMINI_RETRY_JITTER, GEMINI_RETRY_JITTER))
+            logger.warning(f"Gemini call failed ({e.__class__.__name__}), retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+
+# Gemini calls currently in flight, keyed like the response cache, so identical
+# concurrent requests share one call
+_inflight_generations: Dict[str, asyncio.Future] = {}
+
+
+async def _generate_content_text(model: genai.GenerativeModel, prompt: str, generation_config) -> str:
+    return (await _generate_content(model, prompt, generation_config)).text
+
+
+def _finish_inflight_generation(cache_key: str, task: asyncio.Future) -> None:
+    _inflight_generations.pop(cache_key, None)
+    # Mark the error as retrieved in case every waiter was cancelled
+    if not task.cancelled():
+        task.exception()
+
+
+async def _generate_text(cache_key: str, model: genai.GenerativeModel, prompt: str, generation_config) -> str:
+    """
+    Get the response text for a prompt from the cache, from an identical call already
+    in flight, or from a new Gemini call (see _generate_content).
+
+    The caller validates the text and stores it with _cache_response.
+    """
+    response_text = _get_cached_response(cache_key)
+    if response_text is not None:
+        return response_text
+
+    call = _inflight_generations.get(cache_key)
+    if call is None:
+        call = asyncio.ensure_future(_generate_content_text(model, prompt, generation_config))
+        _inflight_generations[cache_key] = call
+        call.add_done_callback(lambda task: _finish_inflight_generation(cache_key, task))
 
-Return ONLY the JSON array, no additional text or explanation."""
+    # Shielded so one caller being cancelled does not cancel the call for the others
+    return await asyncio.shield(call)
+
+
+def get_prompt_template(address: str) -> str:
+    """
+    Generate the prompt template for Gemini API to create thematic tour options.
+
+    Only the address-specific part is built here; the role and guidelines are
+    sent once as the model's system instruction (THEME_SYSTEM_INSTRUCTION).
+
+    Args:
+        address: The location address for which to generate tour themes
+
+    Returns:
+        Formatted prompt string
+    """
+    prompt = f"""Location Address: {address}"""
 
     return prompt
 
@@ -67,7 +283,7 @@ async def generate_theme_options(address: Optional[str] = None, latitude: Option
     # If coordinates are provided, convert them to address first
     if latitude is not None and longitude is not None:
         try:
-            address = get_address_from_coordinates(latitude, longitude)
+            address = await get_address_from_coordinates(latitude, longitude)
         except Exception as e:
             raise Exception(f"Error converting coordinates to address: {str(e)}")
 
@@ -75,38 +291,21 @@ async def generate_theme_options(address: Optional[str] = None, latitude: Option
     if address is None:
         raise ValueError("Address is required but was not provided")
 
-    # Configure Gemini API
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise ValueError("GEMINI_API_KEY not found in environment variables")
-
-    genai.configure(api_key=api_key)
-
-    # Initialize the model
-    model = genai.GenerativeModel('gemini-3-flash-preview')
+    # Shared model instance, configured once at import
+    model = _get_model("themes")
 
     # Get the prompt
     prompt = get_prompt_template(address)
 
-    try:
-        # Generate content
-        response = model.generate_content(prompt)
-
-        # Extract the response text
-        response_text = response.text.strip()
-
-        # Remove markdown code blocks if present
-        if response_text.startswith("```json"):
-            response_text = response_text[7:]
-        if response_text.startswith("```"):
-            response_text = response_text[3:]
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]
+    # Identical prompts (same address/constraints) are served from the cache
+    cache_key = _prompt_cache_key(prompt)
 
-        response_text = response_text.strip()
+    try:
+        # Cached, shared with an identical call in flight, or generated in a worker thread
+        response_text = await _generate_text(cache_key, model, prompt, _THEMES_CONFIG)
 
         # Parse JSON response
-        themes = json.loads(response_text)
+        themes = orjson.loads(response_text)
 
         # Validate that it's a list
         if not isinstance(themes, list):
@@ -116,9 +315,10 @@ async def generate_theme_options(address: Optional[str] = None, latitude: Option
         if len(themes) == 0:
             raise Exception("No themes returned from Gemini API")
 
+        _cache_response(cache_key, response_text)
         return themes
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise Exception(f"Failed to parse Gemini response as JSON: {str(e)}")
     except Exception as e:
         raise Exception(f"Error calling Gemini API: {str(e)}")
@@ -128,6 +328,9 @@ def get_poi_prompt_template(address: str, time_constraint: str, distance_constra
     """
     Generate the prompt template for Gemini API to create a list of POIs (Points of Interest).
 
+    Only the request-specific part is built here; the role and guidelines are
+    sent once as the model's system instruction (POI_SYSTEM_INSTRUCTION).
+
     Args:
         address: The user's current location address
         time_constraint: Time available for visiting POIs (e.g., "2 hours", "half day", "full day")
@@ -139,40 +342,12 @@ def get_poi_prompt_template(address: str, time_constraint: str, distance_constra
     """
     # Use .format() instead of f-string to safely handle variables that might contain curly braces
     # The .format() method safely inserts values without interpreting braces in them as format specifiers
-    prompt = """You are a knowledgeable local tour guide. Based on the user's current location and their constraints, recommend relevant Points of Interest (POIs) they can visit.
-
-User Location: {address}
+    prompt = """User Location: {address}
 
 Constraints:
 - Time Available: {time_constraint}
 - Maximum Distance: {distance_constraint}
-- User Preferences: {user_custom_info}
-
-Please generate a list of POIs that match these constraints. Consider the time needed to travel and visit each location.
-
-IMPORTANT: Return ONLY a valid JSON array with the following structure, nothing else:
-[
-    {{
-        "poi_title": "15 Yarwood Avenue",
-        "address": "15 Yarwood Ave, Singapore 587987"
-    }},
-    {{
-        "poi_title": "Block 123 Ang Mo Kio Avenue 3",
-        "address": "123 Ang Mo Kio Ave 3, Singapore 560123"
-    }}
-]
-
-Guidelines:
-- Generate 5-10 POIs that can realistically be visited within the given time and distance constraints
-- Prioritize POIs that match the user's preferences
-- Include a variety of POI types (attractions, restaurants, parks, museums, shops, etc.) unless user preferences specify otherwise
-- Ensure each POI title is clear and descriptive
-- Provide complete, accurate addresses for each POI
-- Order POIs by relevance and proximity
-- Ensure the JSON is properly formatted with double quotes
-- Consider travel time between POIs when selecting them
-
-Return ONLY the JSON array, no additional text or explanation.""".format(
+- User Preferences: {user_custom_info}""".format(
         address=str(address),
         time_constraint=str(time_constraint),
         distance_constraint=str(distance_constraint),
@@ -198,52 +373,27 @@ async def generate_pois(address: str, time_constraint: str, distance_constraint:
     Raises:
         Exception: If API call fails or response is invalid
     """
-    # Configure Gemini API
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise ValueError("GEMINI_API_KEY not found in environment variables")
-
-    genai.configure(api_key=api_key)
-
-    # Initialize the model
-    model = genai.GenerativeModel('gemini-3-flash-preview')
+    # Shared model instance, configured once at import
+    model = _get_model("pois")
 
     # Get the prompt
     prompt = get_poi_prompt_template(address, time_constraint, distance_constraint, user_custom_info)
 
-    try:
-        # Generate content
-        response = model.generate_content(prompt)
-
-        # Extract the response text
-        response_text = response.text.strip()
-
-        # Remove markdown code blocks if present
-        if response_text.startswith("```json"):
-            response_text = response_text[7:]
-        if response_text.startswith("```"):
-            response_text = response_text[3:]
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]
+    # Identical prompts (same address/constraints) are served from the cache
+    cache_key = _prompt_cache_key(prompt)
 
-        response_text = response_text.strip()
-
-        # Parse JSON response
-        pois = json.loads(response_text)
-
-        # Validate that it's a list
-        if not isinstance(pois, list):
-            raise Exception("Expected a list of POIs from Gemini API")
+    try:
+        # Cached, shared with an identical call in flight, or generated in a worker thread
+        response_text = await _generate_text(cache_key, model, prompt, _POIS_CONFIG)
 
-        # Validate each POI has required fields
-        for poi in pois:
-            if not isinstance(poi, dict) or 'poi_title' not in poi or 'address' not in poi:
-                raise Exception("Invalid POI format in response")
+        # Parse and validate the JSON response in a single pass
+        pois = _POI_LIST_ADAPTER.validate_json(response_text)
 
+        _cache_response(cache_key, response_text)
         return pois
 
-    except json.JSONDecodeError as e:
-        raise Exception(f"Failed to parse Gemini response as JSON: {str(e)}")
+    except ValidationError as e:
+        raise Exception(f"Invalid POI format in response: {str(e)}")
     except Exception as e:
         raise Exception(f"Error calling Gemini API: {str(e)}")
 
@@ -263,15 +413,15 @@ async def validate_user_request_guardrail(user_address: str, max_time: str, dist
     Raises:
         Exception: If API call fails or response is invalid
     """
-    # Configure Gemini API
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise ValueError("GEMINI_API_KEY not found in environment variables")
-
-    genai.configure(api_key=api_key)
+    decision_key = tuple(
+        value.strip().casefold() for value in (user_address, max_time, distance, custom_message)
+    )
+    is_valid = _guardrail_cache.get(decision_key)
+    if is_valid is not None:
+        return is_valid
 
-    # Initialize the model
-    model = genai.GenerativeModel('gemini-3-flash-preview')
+    # Shared model instance, configured once at import
+    model = _get_model("guardrail")
 
     # Create the validation prompt
     prompt = f"""You are a location and tour validation expert. Your job is to determine if a user's tour request makes sense given their current location.
@@ -308,39 +458,31 @@ Return your answer in this EXACT JSON format, nothing else:
 
 IMPORTANT: Return ONLY the JSON object, no additional text."""
 
-    try:
-        # Generate content - run in thread executor to avoid blocking the event loop
-        # This ensures FastAPI can handle other requests and send responses properly
-        loop = asyncio.get_running_loop()
-        response = await loop.run_in_executor(None, model.generate_content, prompt)
-
-        # Extract the response text
-        response_text = response.text.strip()
+    # Identical requests already in flight share one Gemini call
+    cache_key = _prompt_cache_key(prompt)
 
-        # Remove markdown code blocks if present
-        if response_text.startswith("```json"):
-            response_text = response_text[7:]
-        if response_text.startswith("```"):
-            response_text = response_text[3:]
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]
-
-        response_text = response_text.strip()
+    try:
+        # Shared with an identical call in flight, or generated in a worker thread
+        # so FastAPI can handle other requests and send responses properly
+        response_text = await _generate_text(cache_key, model, prompt, _GUARDRAIL_CONFIG)
 
         # Parse JSON response
-        result = json.loads(response_text)
+        result = orjson.loads(response_text)
 
         # Validate response structure
         if 'valid' not in result:
             raise Exception("Invalid response format from Gemini API")
 
+        is_valid = result.get('valid', False)
+        _guardrail_cache[decision_key] = is_valid
+
         # Log the validation reason
-        print(f"🛡️ Guardrail validation for '{custom_message}' at '{user_address}': {result.get('valid')}")
+        print(f"🛡️ Guardrail validation for '{custom_message}' at '{user_address}': {is_valid}")
         print(f"   Reason: {result.get('reason', 'No reason provided')}")
 
-        return result.get('valid', False)
+        return is_valid
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"❌ Failed to parse guardrail response as JSON: {str(e)}")
         # Default to False if we can't parse the response
         return False
@@ -368,15 +510,8 @@ async def order_pois_for_tour(pois: List[Dict[str, str]], user_address: str, max
     Raises:
         Exception: If API call fails or response is invalid
     """
-    # Configure Gemini API
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise ValueError("GEMINI_API_KEY not found in environment variables")
-
-    genai.configure(api_key=api_key)
-
-    # Initialize the model
-    model = genai.GenerativeModel('gemini-3-flash-preview')
+    # Shared model instance, configured once at import
+    model = _get_model()
 
     # Create POI list for prompt
     poi_list_str = ""
@@ -441,29 +576,21 @@ IMPORTANT:
 - The "story_keywords" should be comma-separated descriptive keywords that relate the POI to the tour theme
 - Return ONLY the JSON object, no additional text."""
 
-    try:
-        # Generate content
-        response = model.generate_content(prompt)
-
-        # Extract the response text
-        response_text = response.text.strip()
-
-        # Remove markdown code blocks if present
-        if response_text.startswith("```json"):
-            response_text = response_text[7:]
-        if response_text.startswith("```"):
-            response_text = response_text[3:]
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]
+    # Identical inputs (same POIs, constraints, theme and feedback) reuse the earlier plan
+    cache_key = _prompt_cache_key(prompt)
 
-        response_text = response_text.strip()
+    try:
+        # Cached, shared with an identical call in flight, or generated in a worker thread
+        response_text = await _generate_text(cache_key, model, prompt, _ORDERING_CONFIG)
 
         # Parse JSON response
-        result = json.loads(response_text)
+        result = orjson.loads(response_text)
 
         if 'ordered_pois' not in result:
             raise Exception("Invalid response format from Gemini API")
 
+        _cache_response(cache_key, response_text)
+
         ordered_pois = result['ordered_pois']
 
         print(f"🗺️ Tour order planned for {len(ordered_pois)} POIs")
@@ -472,7 +599,7 @@ IMPORTANT:
 
         return ordered_pois
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"❌ Failed to parse Gemini ordering response as JSON: {str(e)}")
         # Fallback: return POIs in original order
         return [{"original_index": i+1, "poi_title": poi.get('poi_title'), "poi_address": poi.get('poi_address'), "order": i+1} 
@@ -495,15 +622,8 @@ async def generate_narrative_stories(pois: List[Dict], user_custom_info: str) ->
     Returns:
         List of POIs with updated 'story' field
     """
-    # Configure Gemini API
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise ValueError("GEMINI_API_KEY not found in environment variables")
-
-    genai.configure(api_key=api_key)
-
-    # Initialize the model
-    model = genai.GenerativeModel('gemini-3-flash-preview')
+    # Shared model instance, configured once at import
+    model = _get_model()
 
     # Prepare POIs for prompt (remove gps_location and google_place_img_url)
     clean_pois = []
@@ -513,7 +633,7 @@ async def generate_narrative_stories(pois: List[Dict], user_custom_info: str) ->
         clean_poi.pop('google_place_img_url', None)
         clean_pois.append(clean_poi)
 
-    poi_list_str = json.dumps(clean_pois, indent=2)
+    poi_list_str = orjson.dumps(clean_pois, option=orjson.OPT_INDENT_2).decode()
 
     # Create the storytelling prompt
     prompt = f"""You are a master storyteller and tour guide. I will provide a list of Points of Interest (POIs) in a specific order for a tour.
@@ -545,24 +665,11 @@ Example Output Format:
 Return ONLY the JSON object, no additional text."""
 
     try:
-        # Generate content
-        response = model.generate_content(prompt)
-
-        # Extract the response text
-        response_text = response.text.strip()
-
-        # Remove markdown code blocks if present
-        if response_text.startswith("```json"):
-            response_text = response_text[7:]
-        if response_text.startswith("```"):
-            response_text = response_text[3:]
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]
-
-        response_text = response_text.strip()
+        # Generate content in a worker thread so the event loop is not blocked
+        response = await _generate_content(model, prompt, _STORIES_CONFIG)
 
         # Parse JSON response
-        result = json.loads(response_text)
+        result = orjson.loads(response.text)
 
         if 'stories' not in result or not isinstance(result['stories'], list):
             raise Exception("Invalid response format: 'stories' list missing")
@@ -602,15 +709,8 @@ async def generate_tour_introduction(pois: List[Dict], user_custom_info: str) ->
     Returns:
         String containing the tour introduction
     """
-    # Configure Gemini API
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise ValueError("GEMINI_API_KEY not found in environment variables")
-
-    genai.configure(api_key=api_key)
-
-    # Initialize the model
-    model = genai.GenerativeModel('gemini-3-flash-preview')
+    # Shared model instance, configured once at import
+    model = _get_model()
 
     # Prepare POIs for prompt (simplify to just titles and reasons/descriptions if available)
     simple_pois = []
@@ -632,8 +732,8 @@ The introduction should welcome the user and set the mood for the tour. Do not l
 IMPORTANT: Return ONLY the raw text of the introduction, nothing else. No "Here is the introduction:" or quotes."""
 
     try:
-        # Generate content
-        response = model.generate_content(prompt)
+        # Generate content in a worker thread so the event loop is not blocked
+        response = await _generate_content(model, prompt)
         
         # Extract the response text
         introduction = response.text.strip()
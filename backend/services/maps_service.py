@@ -1,56 +1,462 @@
 import os
+import re
+import asyncio
+import logging
+import threading
 import googlemaps
-from typing import Optional, Dict
+import httpx
+import orjson
+from cachetools import LRUCache, TTLCache
+from functools import lru_cache
+from typing import AsyncIterator, Optional, Dict, List, Set, Tuple
 
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # Redis is optional, the shared geocode cache is skipped without it
+    aioredis = None
 
-def get_address_from_coordinates(latitude: float, longitude: float) -> str:
+logger = logging.getLogger(__name__)
+
+# Per-request timeout (seconds) for Google Maps API calls
+GOOGLE_MAPS_TIMEOUT = 5
+
+# Maximum number of concurrent Maps lookups when verifying a batch of POIs
+VERIFY_CONCURRENCY = 10
+
+# Maximum number of reverse-geocoding results kept in memory, and for how long (seconds)
+GEOCODE_CACHE_SIZE = 4096
+GEOCODE_CACHE_TTL = 24 * 60 * 60
+
+# Timeout (seconds) for proxied Places photo downloads, which are much larger than JSON lookups
+PLACE_PHOTO_TIMEOUT = 30.0
+
+# Maximum number of POI verification outcomes kept in memory, keyed by normalized address
+POI_VERIFICATION_CACHE_SIZE = 10_000
+
+# Maximum number of place-details lookups kept in memory, and for how long (seconds)
+PLACE_DETAILS_CACHE_SIZE = 8192
+PLACE_DETAILS_CACHE_TTL = 24 * 60 * 60
+
+# Decimal places kept when normalizing coordinates for the cache (~1 m)
+COORDINATE_PRECISION = 5
+
+# Shared Redis reverse-geocoding cache (enabled by REDIS_URL): coordinates are
+# rounded to ~100 m so nearby lookups from any worker hit the same entry
+REDIS_GEOCODE_TTL = 48 * 60 * 60
+REDIS_COORDINATE_PRECISION = 3
+REDIS_TIMEOUT = 0.25
+
+# Reverse-geocoding lookups arriving within this window (seconds) are coalesced,
+# up to this many distinct coordinate pairs per batch
+GEOCODE_BATCH_WINDOW = 0.02
+GEOCODE_BATCH_MAX_SIZE = 32
+
+
+# Upper bound on Maps REST requests in flight across the whole process; bursts
+# queue here instead of opening ever more connections
+MAPS_MAX_IN_FLIGHT = 50
+
+# Maps REST requests started per second, kept under Google's 50 QPS geocoding
+# limit so bursts are paced locally instead of failing with OVER_QUERY_LIMIT
+MAPS_MAX_REQUESTS_PER_SECOND = 45
+
+
+# Shared async client for the Maps REST endpoints. HTTP/2 multiplexes concurrent
+# lookups over a few TLS connections, which are kept alive between bursts
+_http_client = httpx.AsyncClient(
+    base_url="https://maps.googleapis.com",
+    http2=True,
+    timeout=httpx.Timeout(GOOGLE_MAPS_TIMEOUT, connect=2.0),
+    limits=httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=60)
+)
+_maps_semaphore = asyncio.Semaphore(MAPS_MAX_IN_FLIGHT)
+
+# Maps REST endpoint paths, relative to the shared client's base URL
+_GEOCODE_PATH = "/maps/api/geocode/json"
+_PLACE_PHOTO_PATH = "/maps/api/place/photo"
+
+
+class _RateLimiter:
     """
-    Convert latitude and longitude coordinates to a human-readable address using Google Maps Geocoding API.
+    Token bucket admitting at most `rate` calls per second, with bursts of up to `rate`.
 
-    Args:
-        latitude: The latitude coordinate
-        longitude: The longitude coordinate
+    Waiters are admitted in arrival order.
+    """
 
-    Returns:
-        Formatted address string
+    def __init__(self, rate: float):
+        self._rate = rate
+        self._tokens = rate
+        self._updated: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    self._tokens = min(self._rate, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+_maps_rate_limiter = _RateLimiter(MAPS_MAX_REQUESTS_PER_SECOND)
+
+# Raw reverse-geocoding results (first match), keyed by normalized coordinates.
+# Shared by every function deriving data from a reverse geocode
+_reverse_geocode_cache: TTLCache = TTLCache(maxsize=GEOCODE_CACHE_SIZE, ttl=GEOCODE_CACHE_TTL)
+
+# Coordinates per normalized address (forward geocoding); user start addresses recur across tours
+_forward_geocode_cache: TTLCache = TTLCache(maxsize=GEOCODE_CACHE_SIZE, ttl=GEOCODE_CACHE_TTL)
+
+# Fields of a reverse-geocoding result that get_address_from_coordinates and
+# get_detailed_location_info read; the rest of the payload is not kept
+_REVERSE_GEOCODE_FIELDS = ('formatted_address', 'place_id', 'types', 'address_components')
+
+# Reverse-geocoding lookups currently in flight, keyed by normalized coordinates
+_inflight_reverse_geocodes: Dict[Tuple[float, float], asyncio.Future] = {}
+
+# Verified formatted address (or None if rejected) per normalized POI address.
+# Landmarks recur across tours, so repeated verifications skip the Maps request
+_poi_verification_cache: LRUCache = LRUCache(maxsize=POI_VERIFICATION_CACHE_SIZE)
+
+# Place details per (normalized title, normalized address); popular POIs recur across tours.
+# get_place_details runs in worker threads, so the cache is guarded by a lock
+_place_details_cache: TTLCache = TTLCache(maxsize=PLACE_DETAILS_CACHE_SIZE, ttl=PLACE_DETAILS_CACHE_TTL)
+_place_details_lock = threading.Lock()
+
+_WHITESPACE_RE = re.compile(r'\s+')
+# Punctuation dropped when normalizing addresses; commas separate address parts and
+# '#'/'-' carry unit numbers (e.g. #01-02), so they are kept
+_ADDRESS_PUNCTUATION_RE = re.compile(r'[^\w\s,#-]')
+
+
+@lru_cache(maxsize=1)
+def _get_api_key() -> str:
+    """
+    Get the Google Maps API key.
+
+    Read from the environment once; a missing key is not cached, so it is re-checked on the next call.
 
     Raises:
-        ValueError: If API key is not found or coordinates are invalid
-        Exception: If geocoding fails
+        ValueError: If GOOGLE_MAPS_API_KEY is not set
     """
-    # Get Google Maps API key
     api_key = os.getenv("GOOGLE_MAPS_API_KEY")
     if not api_key:
         raise ValueError("GOOGLE_MAPS_API_KEY not found in environment variables")
+    return api_key
 
+
+def configure_maps() -> None:
+    """
+    Check that the Google Maps API key is configured.
+
+    Called once at application startup so a missing API key fails fast instead
+    of on the first request.
+
+    Raises:
+        RuntimeError: If GOOGLE_MAPS_API_KEY is not set
+    """
     try:
-        # Initialize Google Maps client
-        gmaps = googlemaps.Client(key=api_key)
+        _get_api_key()
+    except ValueError as e:
+        raise RuntimeError(str(e)) from e
 
-        # Perform reverse geocoding
-        result = gmaps.reverse_geocode((latitude, longitude))  # type: ignore[attr-defined]
 
-        if not result or len(result) == 0:
-            raise Exception("No address found for the given coordinates")
+@lru_cache(maxsize=1)
+def _get_client() -> googlemaps.Client:
+    """
+    Get the shared Google Maps client.
 
-        # Get the formatted address from the first result
-        formatted_address = result[0].get('formatted_address', '')
+    Built once so its underlying requests.Session (and its pooled keep-alive
+    connections) is reused across calls.
 
-        if not formatted_address:
-            raise Exception("Could not extract formatted address from geocoding result")
+    Raises:
+        ValueError: If GOOGLE_MAPS_API_KEY is not set
+    """
+    return googlemaps.Client(key=_get_api_key(), timeout=GOOGLE_MAPS_TIMEOUT)
 
-        return formatted_address
 
-    except googlemaps.exceptions.ApiError as e:
-        raise Exception(f"Google Maps API error: {str(e)}")
+@lru_cache(maxsize=1)
+def _get_redis():
+    """
+    Get the shared Redis client, or None when REDIS_URL is unset or redis is not installed.
+    """
+    redis_url = os.getenv("REDIS_URL")
+    if not redis_url or aioredis is None:
+        return None
+    return aioredis.from_url(redis_url, socket_timeout=REDIS_TIMEOUT, socket_connect_timeout=REDIS_TIMEOUT)
+
+
+async def _maps_get(path: str, params: Dict[str, str]) -> dict:
+    """
+    GET a Maps REST endpoint through the shared client and return the decoded JSON body.
+
+    Callers pass only the per-request parameters; the API key is added here. Requests
+    are paced by the process-wide rate limiter before taking a connection slot.
+    """
+    await _maps_rate_limiter.acquire()
+    async with _maps_semaphore:
+        response = await _http_client.get(path, params={"key": _get_api_key(), **params})
+    response.raise_for_status()
+    # orjson decodes straight from the response bytes; httpx's .json() goes through stdlib json
+    return orjson.loads(response.content)
+
+
+async def fetch_place_photo(photo_reference: str, maxwidth: int) -> httpx.Response:
+    """
+    Download a Places photo through the shared client, following the redirect to the image host.
+
+    Raises:
+        ValueError: If GOOGLE_MAPS_API_KEY is not set
+        httpx.HTTPError: If the download fails
+    """
+    params = {"maxwidth": str(maxwidth), "photo_reference": photo_reference, "key": _get_api_key()}
+    async with _maps_semaphore:
+        response = await _http_client.get(
+            _PLACE_PHOTO_PATH,
+            params=params,
+            timeout=PLACE_PHOTO_TIMEOUT,
+            follow_redirects=True
+        )
+    response.raise_for_status()
+    return response
+
+
+async def close_http_client() -> None:
+    """
+    Close the shared async HTTP client (and Redis client, if any). Called on application shutdown.
+    """
+    await _http_client.aclose()
+
+    redis_client = _get_redis()
+    if redis_client is not None:
+        await redis_client.aclose()
+
+
+def _normalize_coordinates(latitude: float, longitude: float) -> Tuple[float, float]:
+    """
+    Round coordinates so nearby lookups for the same spot share a cache entry.
+    """
+    return (round(float(latitude), COORDINATE_PRECISION), round(float(longitude), COORDINATE_PRECISION))
+
+
+def _redis_geocode_key(latitude: float, longitude: float) -> str:
+    return f"geocode:{latitude:.{REDIS_COORDINATE_PRECISION}f},{longitude:.{REDIS_COORDINATE_PRECISION}f}"
+
+
+def _redis_address_key(normalized_address: str) -> str:
+    return f"geocode:address:{normalized_address}"
+
+
+async def _redis_get_json(key: str):
+    """
+    Look up a cached geocoding result in Redis. Redis errors are logged and treated as a miss.
+    """
+    redis_client = _get_redis()
+    if redis_client is None:
+        return None
+    try:
+        cached = await redis_client.get(key)
+    except Exception as e:
+        logger.warning(f"Redis geocode cache read failed: {e}")
+        return None
+    return orjson.loads(cached) if cached else None
+
+
+async def _redis_set_json(key: str, value) -> None:
+    """
+    Store a geocoding result in Redis. Redis errors are logged and ignored.
+    """
+    redis_client = _get_redis()
+    if redis_client is None:
+        return
+    try:
+        await redis_client.setex(key, REDIS_GEOCODE_TTL, orjson.dumps(value))
+    except Exception as e:
+        logger.warning(f"Redis geocode cache write failed: {e}")
+
+
+class _GeocodeBatcher:
+    """
+    Coalesces reverse-geocoding lookups that arrive within a short window.
+
+    Lookups are collected for GEOCODE_BATCH_WINDOW seconds (or until
+    GEOCODE_BATCH_MAX_SIZE distinct keys are pending), then one request is sent
+    per distinct normalized coordinate pair and its result is fanned out to every
+    caller waiting on that key.
+    """
+
+    def __init__(self, fetch, window: float, max_batch_size: int):
+        self._fetch = fetch
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._pending: Dict[Tuple[float, float], List[asyncio.Future]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Keep references to in-flight requests so they are not garbage collected
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def lookup(self, key: Tuple[float, float]) -> str:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, {}
+        for key, futures in batch.items():
+            task = asyncio.ensure_future(self._resolve(key, futures))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, key: Tuple[float, float], futures: List[asyncio.Future]) -> None:
+        try:
+            result = await self._fetch(*key)
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for future in futures:
+                if not future.done():
+                    future.set_result(result)
+
+
+async def _reverse_geocode(latitude: float, longitude: float) -> dict:
+    try:
+        # Perform reverse geocoding
+        data = await _maps_get(
+            _GEOCODE_PATH,
+            params={"latlng": f"{latitude},{longitude}"}
+        )
+
+        status = data.get('status')
+        if status not in ('OK', 'ZERO_RESULTS'):
+            raise Exception(f"Google Maps API error: {status} {data.get('error_message', '')}".strip())
+
+        result = data.get('results', [])
+        if not result:
+            raise Exception("No address found for the given coordinates")
+
+        # Keep only the fields read downstream (geometry, bounds, plus_code, ... are
+        # dropped), so the memory and Redis caches hold small entries
+        first = result[0]
+        return {field: first[field] for field in _REVERSE_GEOCODE_FIELDS if field in first}
+
     except Exception as e:
         raise Exception(f"Error during reverse geocoding: {str(e)}")
 
 
-def get_coordinates_from_address(address: str) -> tuple:
+_geocode_batcher = _GeocodeBatcher(
+    _reverse_geocode,
+    window=GEOCODE_BATCH_WINDOW,
+    max_batch_size=GEOCODE_BATCH_MAX_SIZE
+)
+
+
+async def _get_reverse_geocode_result(latitude: float, longitude: float) -> dict:
+    """
+    Get the first reverse-geocoding match for a coordinate pair.
+
+    Results are cached in memory per normalized coordinate pair, then in Redis
+    (when configured) per ~100 m cell. Callers asking for a pair whose lookup is
+    already in flight await that lookup instead of starting another one. The
+    returned dict is the cached entry and must not be mutated.
+
+    Raises:
+        ValueError: If API key is not found
+        Exception: If geocoding fails
+    """
+    cache_key = _normalize_coordinates(latitude, longitude)
+    result = _reverse_geocode_cache.get(cache_key)
+    if result is not None:
+        return result
+
+    # Fail fast on a missing key instead of inside the shared lookup
+    _get_api_key()
+
+    lookup = _inflight_reverse_geocodes.get(cache_key)
+    if lookup is None:
+        lookup = asyncio.ensure_future(_fetch_reverse_geocode_result(cache_key))
+        _inflight_reverse_geocodes[cache_key] = lookup
+        lookup.add_done_callback(lambda task: _finish_inflight_lookup(cache_key, task))
+
+    # Shielded so one caller being cancelled does not cancel the lookup for the others
+    return await asyncio.shield(lookup)
+
+
+async def _fetch_reverse_geocode_result(cache_key: Tuple[float, float]) -> dict:
+    result = await _redis_get_json(_redis_geocode_key(*cache_key))
+    if result is not None:
+        _reverse_geocode_cache[cache_key] = result
+        return result
+
+    result = await _geocode_batcher.lookup(cache_key)
+
+    # Only successful lookups are cached
+    _reverse_geocode_cache[cache_key] = result
+    await _redis_set_json(_redis_geocode_key(*cache_key), result)
+    return result
+
+
+def _finish_inflight_lookup(cache_key: Tuple[float, float], task: asyncio.Future) -> None:
+    _inflight_reverse_geocodes.pop(cache_key, None)
+    # Mark the error as retrieved in case every waiter was cancelled
+    if not task.cancelled():
+        task.exception()
+
+
+async def get_address_from_coordinates(latitude: float, longitude: float) -> str:
+    """
+    Convert latitude and longitude coordinates to a human-readable address using Google Maps Geocoding API.
+
+    Calls the Geocoding REST endpoint through the shared async HTTP client so the
+    event loop is not blocked. Results are cached in memory per normalized
+    coordinate pair, and concurrent lookups of the same pair share one request.
+
+    Args:
+        latitude: The latitude coordinate
+        longitude: The longitude coordinate
+
+    Returns:
+        Formatted address string
+
+    Raises:
+        ValueError: If API key is not found or coordinates are invalid
+        Exception: If geocoding fails
+    """
+    result = await _get_reverse_geocode_result(latitude, longitude)
+
+    # Get the formatted address from the first result
+    formatted_address = result.get('formatted_address', '')
+
+    if not formatted_address:
+        raise Exception("Error during reverse geocoding: Could not extract formatted address from geocoding result")
+
+    return formatted_address
+
+
+async def get_coordinates_from_address(address: str) -> Tuple[float, float]:
     """
     Convert an address to latitude and longitude coordinates using Google Maps Geocoding API.
 
+    Calls the Geocoding REST endpoint through the shared async HTTP client. Results
+    are cached in memory per normalized address, then in Redis (when configured).
+
     Args:
         address: The address to geocode
 
@@ -61,39 +467,57 @@ def get_coordinates_from_address(address: str) -> tuple:
         ValueError: If API key is not found or address cannot be geocoded
         Exception: If geocoding fails
     """
-    api_key = os.getenv("GOOGLE_MAPS_API_KEY")
-    if not api_key:
-        raise ValueError("GOOGLE_MAPS_API_KEY not found in environment variables")
+    cache_key = _normalize_address(address)
+    coordinates = _forward_geocode_cache.get(cache_key)
+    if coordinates is not None:
+        return coordinates
 
-    try:
-        gmaps = googlemaps.Client(key=api_key)
+    cached = await _redis_get_json(_redis_address_key(cache_key))
+    if cached is not None:
+        coordinates = (cached[0], cached[1])
+        _forward_geocode_cache[cache_key] = coordinates
+        return coordinates
 
-        # Perform geocoding
-        result = gmaps.geocode(address)  # type: ignore[attr-defined]
+    data = await _maps_get(_GEOCODE_PATH, params={"address": address})
 
-        if not result or len(result) == 0:
-            raise ValueError(f"No coordinates found for address: {address}")
+    status = data.get('status')
+    if status == 'ZERO_RESULTS' or (status == 'OK' and not data.get('results')):
+        raise ValueError(f"No coordinates found for address: {address}")
+    if status != 'OK':
+        raise Exception(f"Google Maps API error: {status} {data.get('error_message', '')}".rstrip())
 
-        # Get the location from the first result
-        location = result[0].get('geometry', {}).get('location', {})
-        latitude = location.get('lat')
-        longitude = location.get('lng')
+    # Get the location from the first result
+    location = data['results'][0].get('geometry', {}).get('location', {})
+    latitude = location.get('lat')
+    longitude = location.get('lng')
 
-        if latitude is None or longitude is None:
-            raise ValueError(f"Could not extract coordinates from geocoding result for: {address}")
+    if latitude is None or longitude is None:
+        raise ValueError(f"Could not extract coordinates from geocoding result for: {address}")
 
-        return (latitude, longitude)
+    # Only successful lookups are cached
+    coordinates = (latitude, longitude)
+    _forward_geocode_cache[cache_key] = coordinates
+    await _redis_set_json(_redis_address_key(cache_key), coordinates)
+    return coordinates
 
-    except googlemaps.exceptions.ApiError as e:
-        raise Exception(f"Google Maps API error: {str(e)}")
-    except Exception as e:
-        raise Exception(f"Error during geocoding: {str(e)}")
+
+def get_cached_coordinates(address: str) -> Optional[Tuple[float, float]]:
+    """
+    Get the coordinates of an address if they are already known, without calling Google Maps.
+
+    Addresses geocoded by get_coordinates_from_address and POI addresses verified by
+    verify_poi_exists (keyed by their formatted address) are known.
+    """
+    return _forward_geocode_cache.get(_normalize_address(address))
 
 
-def get_detailed_location_info(latitude: float, longitude: float) -> dict:
+async def get_detailed_location_info(latitude: float, longitude: float) -> dict:
     """
     Get detailed location information including address components.
 
+    Shares the reverse-geocoding cache with get_address_from_coordinates, so
+    asking for both for the same coordinates costs a single Maps request.
+
     Args:
         latitude: The latitude coordinate
         longitude: The longitude coordinate
@@ -105,27 +529,17 @@ def get_detailed_location_info(latitude: float, longitude: float) -> dict:
         ValueError: If API key is not found
         Exception: If geocoding fails
     """
-    api_key = os.getenv("GOOGLE_MAPS_API_KEY")
-    if not api_key:
-        raise ValueError("GOOGLE_MAPS_API_KEY not found in environment variables")
-
     try:
-        gmaps = googlemaps.Client(key=api_key)
-        result = gmaps.reverse_geocode((latitude, longitude))  # type: ignore[attr-defined]
-
-        if not result or len(result) == 0:
-            raise Exception("No location information found for the given coordinates")
-
-        location_data = result[0]
+        location_data = await _get_reverse_geocode_result(latitude, longitude)
 
         # Extract relevant components
         address_components = location_data.get('address_components', [])
 
-        # Build a structured location info
+        # Build a structured location info (copying, the cached result is shared)
         location_info = {
             'formatted_address': location_data.get('formatted_address', ''),
             'place_id': location_data.get('place_id', ''),
-            'types': location_data.get('types', []),
+            'types': list(location_data.get('types', [])),
             'components': {}
         }
 
@@ -137,14 +551,73 @@ def get_detailed_location_info(latitude: float, longitude: float) -> dict:
 
         return location_info
 
+    except ValueError:
+        raise
     except Exception as e:
         raise Exception(f"Error getting location information: {str(e)}")
 
 
-def verify_poi_exists(poi_title: str, address: str) -> Optional[str]:
+def _normalize_address(address: str) -> str:
+    """
+    Normalize an address so trivially different spellings share a cache entry.
+    """
+    address = _ADDRESS_PUNCTUATION_RE.sub('', address.lower())
+    return _WHITESPACE_RE.sub(' ', address).replace(' ,', ',').strip(' ,')
+
+
+def _evaluate_geocode_result(address: str, data: dict) -> Optional[str]:
+    """
+    Decide whether a forward-geocoding response confirms that an address exists.
+
+    Returns:
+        The formatted address if verified, None otherwise
+    """
+    geocode_result = data.get('results', [])
+    if not geocode_result:
+        logger.info("❌ Address not found: %s", address)
+        return None
+
+    result = geocode_result[0]
+
+    # Check if this is a partial match (Google couldn't find exact address)
+    if result.get('partial_match', False):
+        logger.info("❌ Partial match only (address doesn't fully exist): %s (Google returned: %s)",
+                    address, result.get('formatted_address'))
+        return None
+
+    # Check the location type - it should be specific (street address, premise, etc.)
+    # If it's just a city or country, the address is too vague/doesn't exist
+    geometry = result.get('geometry', {})
+    location_type = geometry.get('location_type', '')
+
+    # ROOFTOP is exact, RANGE_INTERPOLATED is very close
+    # GEOMETRIC_CENTER and APPROXIMATE are too vague
+    if location_type not in ['ROOFTOP', 'RANGE_INTERPOLATED']:
+        logger.info("❌ Location too vague (type: %s): %s (Google returned: %s)",
+                    location_type, address, result.get('formatted_address'))
+        return None
+
+    # Check address types - should include street_address or premise
+    types = result.get('types', [])
+    valid_types = ['street_address', 'premise', 'establishment', 'point_of_interest']
+
+    if not any(valid_type in types for valid_type in valid_types):
+        logger.info("❌ Address is not specific enough (types: %s): %s (Google returned: %s)",
+                    types, address, result.get('formatted_address'))
+        return None
+
+    formatted_address = result.get('formatted_address', '')
+    logger.debug("✅ Verified address: %s (Maps address: %s)", address, formatted_address)
+    return formatted_address
+
+
+async def verify_poi_exists(poi_title: str, address: str) -> Optional[str]:
     """
     Verify if a POI exists in reality by geocoding its address.
 
+    Uses the shared async HTTP client, so several POIs can be verified concurrently.
+    Outcomes are cached in memory per normalized address; failed requests are not cached.
+
     Args:
         poi_title: The name/title of the POI
         address: The address of the POI
@@ -152,87 +625,133 @@ def verify_poi_exists(poi_title: str, address: str) -> Optional[str]:
     Returns:
         The formatted address if verified, None otherwise
     """
-    api_key = os.getenv("GOOGLE_MAPS_API_KEY")
-    if not api_key:
-        raise ValueError("GOOGLE_MAPS_API_KEY not found in environment variables")
+    cache_key = _normalize_address(address)
+    if cache_key in _poi_verification_cache:
+        return _poi_verification_cache[cache_key]
 
-    try:
-        gmaps = googlemaps.Client(key=api_key)
+    # Fail fast on a missing key, it is not a per-POI failure
+    _get_api_key()
 
+    try:
         # Geocode the address to verify it exists
-        geocode_result = gmaps.geocode(address)  # type: ignore[attr-defined]
+        data = await _maps_get(
+            _GEOCODE_PATH,
+            params={"address": address}
+        )
+    except Exception as e:
+        logger.warning("❌ Error verifying POI '%s': %s", poi_title, e)
+        return None
 
-        if not geocode_result or len(geocode_result) == 0:
-            print(f"❌ Address not found: {address}")
-            return None
+    status = data.get('status')
+    if status not in ('OK', 'ZERO_RESULTS'):
+        logger.warning("❌ Google Maps API error while verifying POI '%s': %s %s",
+                       poi_title, status, data.get('error_message', ''))
+        return None
 
-        result = geocode_result[0]
+    verified_address = _evaluate_geocode_result(address, data)
+    _poi_verification_cache[cache_key] = verified_address
+    if verified_address:
+        # Keep the coordinates so tour planning can estimate distances without another lookup
+        location = data['results'][0].get('geometry', {}).get('location', {})
+        if location.get('lat') is not None and location.get('lng') is not None:
+            _forward_geocode_cache[_normalize_address(verified_address)] = (location['lat'], location['lng'])
+    return verified_address
 
-        # Check if this is a partial match (Google couldn't find exact address)
-        if result.get('partial_match', False):
-            print(f"❌ Partial match only (address doesn't fully exist): {address}")
-            print(f"   Google returned: {result.get('formatted_address')}")
-            return None
 
-        # Check the location type - it should be specific (street address, premise, etc.)
-        # If it's just a city or country, the address is too vague/doesn't exist
-        geometry = result.get('geometry', {})
-        location_type = geometry.get('location_type', '')
+async def iter_verified_poi_addresses(pois: List[Tuple[str, str]]) -> AsyncIterator[Tuple[int, Optional[str]]]:
+    """
+    Verify several POIs concurrently, yielding each outcome as soon as its lookup completes.
 
-        # ROOFTOP is exact, RANGE_INTERPOLATED is very close
-        # GEOMETRIC_CENTER and APPROXIMATE are too vague
-        if location_type not in ['ROOFTOP', 'RANGE_INTERPOLATED']:
-            print(f"❌ Location too vague (type: {location_type}): {address}")
-            print(f"   Google returned: {result.get('formatted_address')}")
-            return None
+    At most VERIFY_CONCURRENCY lookups are in flight at once to respect API rate limits,
+    and pairs whose addresses normalize to the same string share a single lookup.
 
-        # Check address types - should include street_address or premise
-        types = result.get('types', [])
-        valid_types = ['street_address', 'premise', 'establishment', 'point_of_interest']
+    Args:
+        pois: List of (poi_title, address) pairs
 
-        if not any(valid_type in types for valid_type in valid_types):
-            print(f"❌ Address is not specific enough (types: {types}): {address}")
-            print(f"   Google returned: {result.get('formatted_address')}")
-            return None
+    Yields:
+        (index, verified formatted address or None) for every input pair, in completion order
 
-        formatted_address = result.get('formatted_address', '')
-        print(f"✅ Verified address: {address}")
-        print(f"   Maps address: {formatted_address}")
-        return formatted_address
+    Raises:
+        ValueError: If API key is not found
+    """
+    # Fail fast on a missing key instead of once per POI
+    _get_api_key()
 
-    except googlemaps.exceptions.ApiError as e:
-        print(f"❌ Google Maps API error while verifying POI '{poi_title}': {str(e)}")
-        return None
-    except Exception as e:
-        print(f"❌ Error verifying POI '{poi_title}': {str(e)}")
-        return None
+    # Input positions per normalized address, and the first (poi_title, address) seen for it
+    positions: Dict[str, List[int]] = {}
+    unique: Dict[str, Tuple[str, str]] = {}
+    for index, (poi_title, address) in enumerate(pois):
+        key = _normalize_address(address)
+        unique.setdefault(key, (poi_title, address))
+        positions.setdefault(key, []).append(index)
 
+    semaphore = asyncio.Semaphore(VERIFY_CONCURRENCY)
 
-def verify_multiple_pois(pois: list) -> list:
+    async def verify(key: str, poi_title: str, address: str) -> Tuple[str, Optional[str]]:
+        try:
+            async with semaphore:
+                return key, await verify_poi_exists(poi_title, address)
+        except Exception as e:
+            # One failed lookup only drops that POI, not the whole batch
+            logger.warning("❌ Error verifying POI '%s': %s", poi_title, e)
+            return key, None
+
+    tasks = [
+        asyncio.ensure_future(verify(key, poi_title, address))
+        for key, (poi_title, address) in unique.items()
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            key, verified_address = await next_done
+            for index in positions[key]:
+                yield index, verified_address
+    finally:
+        # The consumer stopped early (e.g. a streaming client disconnected)
+        for task in tasks:
+            task.cancel()
+
+
+async def verify_poi_addresses(pois: List[Tuple[str, str]]) -> List[Optional[str]]:
     """
-    Verify multiple POIs and return only those that exist.
+    Verify several POIs concurrently (see iter_verified_poi_addresses).
 
     Args:
-        pois: List of POI dictionaries with 'poi_title' and 'address' keys
+        pois: List of (poi_title, address) pairs
 
     Returns:
-        Filtered list of verified POIs
+        The verified formatted address for each pair (None if not verified), in input order
 
     Raises:
         ValueError: If API key is not found
     """
-    verified_pois = []
+    verified_addresses: List[Optional[str]] = [None] * len(pois)
+    async for index, verified_address in iter_verified_poi_addresses(pois):
+        verified_addresses[index] = verified_address
+    return verified_addresses
+
+
+async def verify_multiple_pois(pois: list) -> list:
+    """
+    Verify multiple POIs concurrently and return only those that exist.
 
-    for poi in pois:
-        poi_title = poi.get('poi_title', '')
-        address = poi.get('address', '')
+    Args:
+        pois: List of POI dictionaries with 'poi_title' and 'address' keys
+
+    Returns:
+        Filtered list of verified POIs, in input order
+
+    Raises:
+        ValueError: If API key is not found
+    """
+    # Skip POIs with missing data
+    candidates = [poi for poi in pois if poi.get('poi_title') and poi.get('address')]
 
-        if not poi_title or not address:
-            # Skip POIs with missing data
-            continue
+    verified_addresses = await verify_poi_addresses(
+        [(poi['poi_title'], poi['address']) for poi in candidates]
+    )
 
-        # Verify if the POI exists
-        verified_address = verify_poi_exists(poi_title, address)
+    verified_pois = []
+    for poi, verified_address in zip(candidates, verified_addresses):
         if verified_address:
             # Update the address with the official Google Maps formatted address
             poi['address'] = verified_address
@@ -240,6 +759,7 @@ def verify_multiple_pois(pois: list) -> list:
 
     return verified_pois
 
+
 def get_place_details(poi_title: str, address: str) -> Optional[Dict]:
     """
     Get Google Place ID, name, GPS location, and photo URL for a POI.
@@ -250,18 +770,29 @@ def get_place_details(poi_title: str, address: str) -> Optional[Dict]:
 
     Returns:
         Dictionary with place_id, name, formatted_address, gps_location, and photo_url,
-        or None if not found
+        or None if not found. Found places are cached and shared, the dict must not be mutated
 
     Raises:
         ValueError: If API key is not found
     """
-    api_key = os.getenv("GOOGLE_MAPS_API_KEY")
-    if not api_key:
-        raise ValueError("GOOGLE_MAPS_API_KEY not found in environment variables")
+    cache_key = (_WHITESPACE_RE.sub(' ', poi_title).strip().casefold(), _normalize_address(address))
+    with _place_details_lock:
+        place_details = _place_details_cache.get(cache_key)
+    if place_details is not None:
+        return place_details
 
-    try:
-        gmaps = googlemaps.Client(key=api_key)
+    place_details = _fetch_place_details(poi_title, address)
+    # Misses and errors are not cached
+    if place_details is not None:
+        with _place_details_lock:
+            _place_details_cache[cache_key] = place_details
+    return place_details
 
+
+def _fetch_place_details(poi_title: str, address: str) -> Optional[Dict]:
+    gmaps = _get_client()
+
+    try:
         # Search for the POI using find_place
         search_query = f"{poi_title}, {address}"
 
@@ -317,7 +848,7 @@ def get_place_details(poi_title: str, address: str) -> Optional[Dict]:
                     photo_reference = photos[0].get('photo_reference')
                     if photo_reference:
                         # Build the photo URL using Google Places Photos API
-                        photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photo_reference={photo_reference}&key={api_key}"
+                        photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photo_reference={photo_reference}&key={gmaps.key}"
                         
         except (AttributeError, Exception) as e:
             # Fallback if place method doesn't exist or fails - use geocoding on formatted_address
@@ -371,13 +902,9 @@ def calculate_route_metrics(origin: str, waypoints: list, mode: str = 'walking')
     Returns:
         Dictionary with total_distance_km and total_duration_minutes
     """
-    api_key = os.getenv("GOOGLE_MAPS_API_KEY")
-    if not api_key:
-        raise ValueError("GOOGLE_MAPS_API_KEY not found in environment variables")
+    gmaps = _get_client()
 
     try:
-        gmaps = googlemaps.Client(key=api_key)
-
         # Remove origin from waypoints if it's there
         clean_waypoints = [wp for wp in waypoints if wp and wp != origin]
 
@@ -6,13 +6,18 @@ This service handles all POI-related operations including:
 - Verification of POIs using Google Maps
 - Enrichment of POIs with Google Maps details
 """
-from typing import Dict, List
+from typing import AsyncIterator, Dict, List, Tuple
+import asyncio
 import logging
 from services.gemini_service import generate_pois
-from services.maps_service import verify_multiple_pois, get_place_details
+from services.maps_service import verify_multiple_pois, verify_poi_addresses, iter_verified_poi_addresses, get_place_details
+from schemas.tour import POI
 
 logger = logging.getLogger(__name__)
 
+# At most this many POIs are enriched at once; each one makes several Maps requests
+ENRICH_CONCURRENCY = 8
+
 
 class POIService:
     """Service for managing POI operations."""
@@ -53,9 +58,9 @@ class POIService:
 
         return pois_data
 
-    def verify_pois(self, pois_data: List[Dict]) -> List[Dict]:
+    async def verify_pois(self, pois_data: List[Dict]) -> List[Dict]:
         """
-        Verify POIs using Google Maps.
+        Verify POIs concurrently using Google Maps.
 
         Args:
             pois_data: List of POI dictionaries to verify
@@ -65,11 +70,56 @@ class POIService:
         """
         logger.info(f"🔍 Verifying POIs with Google Maps...")
 
-        verified_pois_list = verify_multiple_pois(pois_data)
+        verified_pois_list = await verify_multiple_pois(pois_data)
         logger.info(f"✅ Verified {len(verified_pois_list)} out of {len(pois_data)} POIs")
 
         return verified_pois_list
 
+    async def verify_poi_models(self, pois: List[POI]) -> List[POI]:
+        """
+        Verify POI models concurrently using Google Maps, without converting them to dicts.
+
+        Args:
+            pois: List of POI models to verify
+
+        Returns:
+            Verified POIs with their address replaced by the Google Maps formatted address
+        """
+        logger.info(f"🔍 Verifying POIs with Google Maps...")
+
+        # Skip POIs with missing data
+        candidates = [poi for poi in pois if poi.poi_title and poi.address]
+        verified_addresses = await verify_poi_addresses(
+            [(poi.poi_title, poi.address) for poi in candidates]
+        )
+        verified_pois = [
+            poi.model_copy(update={'address': verified_address})
+            for poi, verified_address in zip(candidates, verified_addresses)
+            if verified_address
+        ]
+        logger.info(f"✅ Verified {len(verified_pois)} out of {len(pois)} POIs")
+
+        return verified_pois
+
+    async def iter_verified_poi_models(self, pois: List[POI]) -> AsyncIterator[Tuple[int, POI]]:
+        """
+        Verify POI models concurrently, yielding each verified POI as soon as its lookup completes.
+
+        Args:
+            pois: List of POI models to verify
+
+        Yields:
+            (index in pois, verified POI with the Google Maps formatted address), in completion order
+        """
+        # Skip POIs with missing data
+        candidates = [(index, poi) for index, poi in enumerate(pois) if poi.poi_title and poi.address]
+        async for position, verified_address in iter_verified_poi_addresses(
+            [(poi.poi_title, poi.address) for _, poi in candidates]
+        ):
+            if verified_address:
+                index, poi = candidates[position]
+                yield index, poi.model_copy(update={'address': verified_address})
+
     def enrich_poi_with_details(self, ordered_poi: Dict) -> Dict:
         """
         Enrich a single POI with Google Maps details.
@@ -117,16 +167,24 @@ class POIService:
                 "gps_location": None
             }
 
-    def enrich_pois_with_details(self, ordered_pois: List[Dict]) -> List[Dict]:
+    async def enrich_pois_with_details(self, ordered_pois: List[Dict]) -> List[Dict]:
         """
-        Enrich all ordered POIs with Google Maps details.
+        Enrich all ordered POIs with Google Maps details, concurrently.
+
+        Each POI's blocking googlemaps lookups run in a worker thread, at most
+        ENRICH_CONCURRENCY at once.
 
         Args:
             ordered_pois: List of ordered POI dictionaries
 
         Returns:
-            List of enriched POI dictionaries
+            List of enriched POI dictionaries, in the same order
         """
         logger.info(f"📍 Enriching {len(ordered_pois)} POIs with Google Maps details...")
-        enriched_pois = [self.enrich_poi_with_details(poi) for poi in ordered_pois]
-        return enriched_pois
+        semaphore = asyncio.Semaphore(ENRICH_CONCURRENCY)
+
+        async def enrich(poi: Dict) -> Dict:
+            async with semaphore:
+                return await asyncio.to_thread(self.enrich_poi_with_details, poi)
+
+        return list(await asyncio.gather(*(enrich(poi) for poi in ordered_pois)))
@@ -6,12 +6,14 @@ This service orchestrates the complete tour generation workflow including:
 - Optimal ordering with retry logic
 - Enrichment and finalization
 """
-from typing import Dict, List
+from typing import Dict, List, Optional
+import asyncio
 import logging
 from services.poi_service import POIService
 from services.tour_service import TourService
-from services.gemini_service import order_pois_for_tour
-from services.maps_service import calculate_route_metrics
+from services.gemini_service import order_pois_for_tour, generate_tour_introduction, generate_narrative_stories
+from services.maps_service import calculate_route_metrics, get_cached_coordinates
+from helpers.geo_helpers import path_length_km
 from helpers.tour_helpers import parse_time_to_minutes, parse_distance_to_km
 
 logger = logging.getLogger(__name__)
@@ -31,6 +33,32 @@ class TourOrchestrationService:
         self.poi_service = poi_service
         self.tour_service = tour_service
 
+    @staticmethod
+    def _straight_line_distance_km(user_address: str, ordered_pois: List[Dict], candidate_pois: List[Dict]) -> Optional[float]:
+        """
+        Estimate the length of a planned tour from already known coordinates, without Google Maps calls.
+
+        Args:
+            user_address: User's starting and ending location
+            ordered_pois: POIs in tour order, as returned by order_pois_for_tour
+            candidate_pois: POI list the order was planned from (original_index refers to it)
+
+        Returns:
+            Straight-line length in km of the round trip, or None if any coordinates are unknown
+        """
+        addresses = []
+        for poi in ordered_pois:
+            index = poi.get('original_index')
+            if isinstance(index, int) and 1 <= index <= len(candidate_pois):
+                addresses.append(candidate_pois[index - 1].get('address', ''))
+            else:
+                addresses.append(poi.get('poi_address', ''))
+
+        points = [get_cached_coordinates(address) for address in [user_address, *addresses, user_address]]
+        if None in points:
+            return None
+        return path_length_km(points)
+
     async def generate_pois_step(
         self,
         transaction_id: str,
@@ -52,9 +80,8 @@ class TourOrchestrationService:
         Returns:
             List of generated POI dictionaries
         """
-        logger.info(f"🔍 Geocoding address: {user_address}")
-        self.tour_service.update_tour_status(transaction_id, "geocoding")
-
+        # The user address was already geocoded when the tour was created, so this goes
+        # straight to "generating_pois" instead of writing a "geocoding" status first
         self.tour_service.update_tour_status(transaction_id, "generating_pois")
         logger.info(f"🤖 Generating POIs with Gemini...")
 
@@ -68,7 +95,7 @@ class TourOrchestrationService:
 
         return pois_data
 
-    def verify_and_store_pois(
+    async def verify_and_store_pois(
         self,
         transaction_id: str,
         pois_data: List[Dict]
@@ -89,7 +116,7 @@ class TourOrchestrationService:
         self.tour_service.update_tour_status(transaction_id, "filtering_pois")
         logger.info(f"🔍 Verifying POIs with Google Maps...")
 
-        verified_pois_list = self.poi_service.verify_pois(pois_data)
+        verified_pois_list = await self.poi_service.verify_pois(pois_data)
         logger.info(f"✅ Verified {len(verified_pois_list)} out of {len(pois_data)} POIs")
 
         # Store filtered POIs in database
@@ -97,8 +124,7 @@ class TourOrchestrationService:
 
         if not verified_pois_list:
             logger.error(f"❌ No POIs were verified for transaction {transaction_id}")
-            self.tour_service.update_tour_status(transaction_id, "failed")
-            self.tour_service.mark_tour_failed(
+            await self.tour_service.mark_tour_failed(
                 transaction_id,
                 "No POIs could be verified in the specified area"
             )
@@ -150,20 +176,34 @@ class TourOrchestrationService:
                 feedback=feedback
             )
 
+            # Parse constraints
+            limit_distance = parse_distance_to_km(distance)
+            limit_time = parse_time_to_minutes(max_time)
+
+            # A route is never shorter than the straight line through its stops, so a plan
+            # that is already too long in a straight line is rejected without a Directions call
+            straight_line_km = self._straight_line_distance_km(user_address, ordered_pois, current_pois)
+            if straight_line_km is not None and straight_line_km > limit_distance * 1.1:
+                logger.warning(f"⚠️ Straight-line distance {straight_line_km:.2f} km exceeds the limit (attempt {attempt + 1})")
+                feedback = (
+                    f"Previous plan exceeded constraints. "
+                    f"Straight-line distance alone: {straight_line_km:.2f}km (limit: {limit_distance}km). "
+                    f"Reduce POIs or choose closer ones."
+                )
+                if attempt == max_retries - 1:
+                    logger.warning("⚠️ Max retries reached, using best effort result")
+                continue
+
             # Prepare waypoints for route calculation
             waypoints = [poi.get('poi_address', '') for poi in ordered_pois]
 
-            # Calculate route metrics
-            metrics = calculate_route_metrics(user_address, waypoints)
+            # Calculate route metrics (blocking googlemaps call, run in a worker thread)
+            metrics = await asyncio.to_thread(calculate_route_metrics, user_address, waypoints)
             total_distance_km = metrics.get('total_distance_km', float('inf'))
             total_duration_min = metrics.get('total_duration_minutes', float('inf'))
 
             logger.info(f"📊 Route metrics: {total_distance_km:.2f} km, {total_duration_min:.0f} min")
 
-            # Parse constraints
-            limit_distance = parse_distance_to_km(distance)
-            limit_time = parse_time_to_minutes(max_time)
-
             # Check if constraints are met (with 10% buffer)
             if total_distance_km <= limit_distance * 1.1 and total_duration_min <= limit_time * 1.1:
                 logger.info("✅ Tour constraints met!")
@@ -197,8 +237,7 @@ class TourOrchestrationService:
         1. Generate POIs based on constraints
         2. Filter/verify POIs using Google Maps
         3. Order POIs optimally and enrich with details
-        4. Generate tour introduction
-        5. Generate narrative stories for each POI
+        4. Generate tour introduction and narrative stories for each POI (concurrently)
 
         Args:
             transaction_id: UUID of the tour
@@ -220,7 +259,7 @@ class TourOrchestrationService:
             )
 
             # Step 2: Verify POIs using Google Maps
-            verified_pois_list = self.verify_and_store_pois(transaction_id, pois_data)
+            verified_pois_list = await self.verify_and_store_pois(transaction_id, pois_data)
 
             # Step 3: Get tour theme
             tour_data = self.tour_service.get_tour(transaction_id)
@@ -239,47 +278,42 @@ class TourOrchestrationService:
             )
 
             # Step 5: Enrich POIs with Google Maps details
-            enriched_pois = self.poi_service.enrich_pois_with_details(ordered_pois)
-
-            # Step 6: Generate introduction for the tour
-            logger.info(f"📝 Generating tour introduction...")
-            from services.gemini_service import generate_tour_introduction
-            introduction = await generate_tour_introduction(
-                pois=enriched_pois,
-                user_custom_info=theme
+            enriched_pois = await self.poi_service.enrich_pois_with_details(ordered_pois)
+
+            # Steps 6 & 7: Generate the introduction and the narrative stories.
+            # Both only depend on the enriched POIs, so the Gemini calls run concurrently
+            logger.info(f"📝 Generating tour introduction and narrative stories...")
+            introduction, pois_with_stories = await asyncio.gather(
+                generate_tour_introduction(
+                    pois=enriched_pois,
+                    user_custom_info=theme
+                ),
+                generate_narrative_stories(
+                    pois=enriched_pois,
+                    user_custom_info=theme
+                )
             )
-            
+
             # Update tour with introduction
-            self.tour_service.tour_repo.update_tour_by_uuid(
-                tour_uuid=transaction_id,
-                updates={"introduction": introduction}
-            )
+            self.tour_service.update_tour_introduction(transaction_id, introduction)
             logger.info(f"✅ Introduction generated: {introduction[:50]}...")
-
-            # Step 7: Generate narrative stories for each POI
-            logger.info(f"📖 Generating narrative stories for POIs...")
-            from services.gemini_service import generate_narrative_stories
-            pois_with_stories = await generate_narrative_stories(
-                pois=enriched_pois,
-                user_custom_info=theme
-            )
             logger.info(f"✅ Stories generated for {len(pois_with_stories)} POIs")
 
             # Step 8: Finalize tour with stories
-            self.tour_service.finalize_tour(transaction_id, pois_with_stories)
+            await self.tour_service.finalize_tour(transaction_id, pois_with_stories)
 
         except ValueError as e:
             # Handle validation errors (e.g., no POIs verified)
             logger.error(f"❌ Validation error in tour generation for {transaction_id}: {str(e)}")
             error_message = str(e)
             if "No POIs could be verified" not in error_message:
-                self.tour_service.mark_tour_failed(transaction_id, error_message)
+                await self.tour_service.mark_tour_failed(transaction_id, error_message)
             raise
         except Exception as e:
             # Handle other errors
             logger.error(f"❌ Error in tour generation for {transaction_id}: {str(e)}")
             logger.exception(e)
-            self.tour_service.mark_tour_failed(transaction_id, str(e))
+            await self.tour_service.mark_tour_failed(transaction_id, str(e))
             raise
 
     async def generate_tour_from_filtered_pois(
@@ -328,20 +362,33 @@ class TourOrchestrationService:
                 feedback=feedback
             )
 
+            # Parse constraints
+            limit_distance = parse_distance_to_km(distance)
+            limit_time = parse_time_to_minutes(max_time)
+
+            # Reject plans that are too long in a straight line without a Directions call
+            straight_line_km = self._straight_line_distance_km(user_address, ordered_pois, current_pois)
+            if straight_line_km is not None and straight_line_km > limit_distance * 1.1:
+                logger.warning("⚠️ Constraints exceeded (straight-line estimate).")
+                feedback = (
+                    f"The previous plan was too long. "
+                    f"Straight-line distance alone: {straight_line_km:.2f} km (Limit: {limit_distance} km). "
+                    f"Please reduce the number of stops or choose closer ones."
+                )
+                if attempt == max_retries - 1:
+                    logger.warning("⚠️ Max retries reached. Returning best effort.")
+                continue
+
             # Prepare waypoints for route calculation
             waypoints = [poi.get('poi_address', '') for poi in ordered_pois]
 
-            # Calculate route metrics
-            metrics = calculate_route_metrics(user_address, waypoints)
+            # Calculate route metrics (blocking googlemaps call, run in a worker thread)
+            metrics = await asyncio.to_thread(calculate_route_metrics, user_address, waypoints)
             total_distance_km = metrics.get('total_distance_km', float('inf'))
             total_duration_min = metrics.get('total_duration_minutes', float('inf'))
 
             logger.info(f"📊 Route metrics: {total_distance_km:.2f} km, {total_duration_min:.0f} min")
 
-            # Parse constraints
-            limit_distance = parse_distance_to_km(distance)
-            limit_time = parse_time_to_minutes(max_time)
-
             # Check if constraints are met (with 10% buffer)
             if total_distance_km <= limit_distance * 1.1 and total_duration_min <= limit_time * 1.1:
                 logger.info("✅ Constraints met!")
@@ -359,6 +406,6 @@ class TourOrchestrationService:
                     logger.warning("⚠️ Max retries reached. Returning best effort.")
 
         # Enrich POIs with Google Maps details
-        enriched_pois = self.poi_service.enrich_pois_with_details(ordered_pois)
+        enriched_pois = await self.poi_service.enrich_pois_with_details(ordered_pois)
 
         return enriched_pois
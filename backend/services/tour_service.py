@@ -4,12 +4,22 @@ Tour Database and Status Management Service.
 This service handles tour database operations and status management.
 """
 from typing import Dict, Optional
+import asyncio
 import logging
+from cachetools import TTLCache
 from database.tour import TourRepository
 from helpers.tour_helpers import parse_time_to_minutes, parse_distance_to_km
+from services.maps_service import get_coordinates_from_address
+from schemas.tour import Tour
 
 logger = logging.getLogger(__name__)
 
+# Parsed Tour models kept in memory for polling clients, and for how long (seconds).
+# Every write through this service evicts the tour, the TTL only bounds staleness
+# from writes made elsewhere
+TOUR_CACHE_SIZE = 1024
+TOUR_CACHE_TTL = 300
+
 
 class TourService:
     """Service for managing tour database operations and status."""
@@ -22,6 +32,10 @@ class TourService:
             tour_repo: TourRepository instance for database operations
         """
         self.tour_repo = tour_repo
+        self._tour_cache: TTLCache = TTLCache(maxsize=TOUR_CACHE_SIZE, ttl=TOUR_CACHE_TTL)
+
+    def _invalidate(self, transaction_id: str) -> None:
+        self._tour_cache.pop(transaction_id, None)
 
     def update_tour_status(self, transaction_id: str, status_code: str) -> None:
         """
@@ -31,6 +45,7 @@ class TourService:
             transaction_id: UUID of the tour
             status_code: New status code to set
         """
+        self._invalidate(transaction_id)
         self.tour_repo.update_tour_by_uuid(
             tour_uuid=transaction_id,
             updates={"status_code": status_code}
@@ -48,8 +63,35 @@ class TourService:
         """
         return self.tour_repo.get_tour_by_uuid(transaction_id)
 
-    def create_tour(self, transaction_id: str, user_address: str, theme: str, status_code: str,
-                    max_time: str, distance: str, constraints: Dict) -> None:
+    def get_tour_model(self, transaction_id: str) -> Optional[Tour]:
+        """
+        Get tour by UUID as a validated Tour model, cached between writes.
+
+        Args:
+            transaction_id: UUID of the tour
+
+        Returns:
+            Tour model (shared, must not be mutated) or None if not found
+
+        Raises:
+            ValidationError: If the stored tour does not match the Tour schema
+        """
+        tour = self._tour_cache.get(transaction_id)
+        if tour is not None:
+            return tour
+
+        tour_data = self.tour_repo.get_tour_by_uuid(transaction_id)
+        if tour_data is None:
+            return None
+
+        if tour_data.get('pois') is None:
+            tour_data = {**tour_data, 'pois': []}
+        tour = Tour.model_validate(tour_data)
+        self._tour_cache[transaction_id] = tour
+        return tour
+
+    async def create_tour(self, transaction_id: str, user_address: str, theme: str, status_code: str,
+                          max_time: str, distance: str, constraints: Dict) -> None:
         """
         Create a new tour in the database.
 
@@ -62,11 +104,10 @@ class TourService:
             distance: Maximum distance constraint
             constraints: Full constraints dictionary
         """
-        # Geocode user address to get coordinates
+        # Geocode user address to get coordinates (cached per normalized address)
         user_location = None
         try:
-            from services.maps_service import get_coordinates_from_address
-            lat, lng = get_coordinates_from_address(user_address)
+            lat, lng = await get_coordinates_from_address(user_address)
             user_location = {"lat": lat, "lng": lng}
             logger.info(f"📍 Geocoded user location: {lat}, {lng}")
         except Exception as e:
@@ -84,6 +125,7 @@ class TourService:
             "storyline_keywords": "",
             "constraints": constraints
         }
+        self._invalidate(transaction_id)
         self.tour_repo.add_tour(tour_data)
 
     def update_filtered_pois(self, transaction_id: str, filtered_pois: list) -> None:
@@ -94,12 +136,13 @@ class TourService:
             transaction_id: UUID of the tour
             filtered_pois: List of filtered POI dictionaries
         """
+        self._invalidate(transaction_id)
         self.tour_repo.update_tour_by_uuid(
             tour_uuid=transaction_id,
             updates={"filtered_candidate_poi_list": filtered_pois}
         )
 
-    def finalize_tour(self, transaction_id: str, enriched_pois: list) -> None:
+    async def finalize_tour(self, transaction_id: str, enriched_pois: list) -> None:
         """
         Finalize tour by updating database with enriched POIs and marking as completed.
 
@@ -107,6 +150,7 @@ class TourService:
             transaction_id: UUID of the tour
             enriched_pois: List of enriched POI dictionaries
         """
+        self._invalidate(transaction_id)
         self.tour_repo.update_tour_by_uuid(
             tour_uuid=transaction_id,
             updates={
@@ -114,11 +158,13 @@ class TourService:
                 "status_code": "completed"
             }
         )
+        # fsync runs in a worker thread so it does not stall the event loop
+        await asyncio.to_thread(self.tour_repo.flush)
 
         logger.info(f"✅ Tour generation completed successfully for transaction {transaction_id}")
         logger.info(f"   Final tour has {len(enriched_pois)} POIs")
 
-    def mark_tour_failed(self, transaction_id: str, error_message: str) -> None:
+    async def mark_tour_failed(self, transaction_id: str, error_message: str) -> None:
         """
         Mark tour as failed with error message.
 
@@ -126,6 +172,7 @@ class TourService:
             transaction_id: UUID of the tour
             error_message: Error message to store
         """
+        self._invalidate(transaction_id)
         self.tour_repo.update_tour_by_uuid(
             tour_uuid=transaction_id,
             updates={
@@ -133,6 +180,7 @@ class TourService:
                 "error_message": error_message
             }
         )
+        await asyncio.to_thread(self.tour_repo.flush)
 
     def update_tour_pois(self, transaction_id: str, pois: list) -> bool:
         """
@@ -145,7 +193,25 @@ class TourService:
         Returns:
             True if updated successfully, False otherwise
         """
+        self._invalidate(transaction_id)
         return self.tour_repo.update_tour_by_uuid(
             tour_uuid=transaction_id,
             updates={"pois": pois}
         )
+
+    def update_tour_introduction(self, transaction_id: str, introduction: str) -> bool:
+        """
+        Update tour with its introduction text.
+
+        Args:
+            transaction_id: UUID of the tour
+            introduction: Introduction text
+
+        Returns:
+            True if updated successfully, False otherwise
+        """
+        self._invalidate(transaction_id)
+        return self.tour_repo.update_tour_by_uuid(
+            tour_uuid=transaction_id,
+            updates={"introduction": introduction}
+        )
@@ -3,24 +3,43 @@ import os
 import hashlib
 import uuid
 import wave
-from google import genai
-from google.genai import types
-from typing import Optional
-from database.database_base import DatabaseBase
+from typing import TYPE_CHECKING, Optional
 from database.tts_storage import TTSRepository
 
+if TYPE_CHECKING:
+    from google import genai
+
 
 class TTSService:
     def __init__(self, tts_repo: TTSRepository, audio_dir: str = "audio"):
         self.tts_repo = tts_repo
         self.audio_dir = audio_dir
         self._ensure_audio_dir()
+        # Built on first use and reused, so TTS calls share the client's pooled connections
+        self._client: Optional["genai.Client"] = None
 
     def _ensure_audio_dir(self):
         """Ensure the audio directory exists."""
         if not os.path.exists(self.audio_dir):
             os.makedirs(self.audio_dir)
 
+    def _get_client(self) -> "genai.Client":
+        """
+        Get the shared Gemini client.
+
+        Raises:
+            ValueError: If GEMINI_API_KEY is not set
+        """
+        if self._client is None:
+            api_key = os.getenv("GEMINI_API_KEY")
+            if not api_key:
+                raise ValueError("GEMINI_API_KEY not found in environment variables")
+            # The google-genai SDK is only needed for TTS, so it is imported on first use
+            # instead of slowing down application startup
+            from google import genai
+            self._client = genai.Client(api_key=api_key)
+        return self._client
+
     def _wave_file(self, filename: str, pcm: bytes, channels: int = 1, rate: int = 24000, sample_width: int = 2):
         """Save PCM audio data to a WAV file."""
         with wave.open(filename, "wb") as wf:
@@ -52,15 +71,29 @@ class TTSService:
         """
         Generate audio from text using Gemini TTS API.
         """
+        filename = self.synthesize_audio(text)
+        self.record_audio(text, filename)
+        return filename
+
+    def record_audio(self, text: str, filename: str) -> None:
+        """
+        Store the text -> audio file mapping so the audio is reused for the same text.
+        """
         text_hash = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        self.tts_repo.save_audio_path(text_hash, filename)
+
+    def synthesize_audio(self, text: str) -> str:
+        """
+        Synthesize audio with the Gemini TTS API and save it to the audio directory,
+        without recording it in the repository.
+
+        Blocking; safe to run in a worker thread since it does not touch the database.
+        """
         filename = f"{uuid.uuid4()}.wav"
         output_path = os.path.join(self.audio_dir, filename)
 
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            raise ValueError("GEMINI_API_KEY not found in environment variables")
-            
-        client = genai.Client(api_key=api_key)
+        client = self._get_client()
+        from google.genai import types
 
         model_id = 'gemini-2.5-flash-preview-tts' 
         
@@ -112,9 +145,6 @@ class TTSService:
             logging.error(f"Failed to save audio data: {e}")
             raise Exception(f"Failed to save audio data: {e}")
 
-        # Save to repository
-        self.tts_repo.save_audio_path(text_hash, filename)
-
         return filename
     
     def get_audio_path(self, filename: str) -> str:
@@ -2,7 +2,7 @@ import sys
 import os
 
 # Add backend directory to path
-sys.path.append(os.path.abspath("/root/git/Jorian-Flow-GDM-Hack-SG-2026/backend"))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 try:
     from database.database_base import DatabaseBase
@@ -6,7 +6,7 @@ import sys
 import os
 
 # Add backend directory to path
-sys.path.append(os.path.abspath("backend"))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from main import app
 from database.database_base import DatabaseBase